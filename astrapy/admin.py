@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 import re
 import time
@@ -31,6 +32,7 @@ from astrapy.authentication import coerce_token_provider
 from astrapy.constants import Environment
 from astrapy.core.defaults import DEFAULT_AUTH_HEADER
 from astrapy.core.ops import AstraDBOps
+from astrapy.core.utils import ResponseCache
 from astrapy.cursors import CommandCursor
 from astrapy.exceptions import (
     DataAPIFaultyResponseException,
@@ -53,6 +55,7 @@ logger = logging.getLogger(__name__)
 
 DATABASE_POLL_NAMESPACE_SLEEP_TIME = 2
 DATABASE_POLL_SLEEP_TIME = 15
+DATABASE_REGION_CACHE_SIZE = 256
 
 STATUS_MAINTENANCE = "MAINTENANCE"
 STATUS_ACTIVE = "ACTIVE"
@@ -233,6 +236,55 @@ def fetch_raw_database_info_from_id_token(
         raise to_dataapi_timeout_exception(texc)
 
 
+# a database does not change region: lookups never expire
+_database_region_cache = ResponseCache(
+    ttl=float("inf"), max_size=DATABASE_REGION_CACHE_SIZE
+)
+
+
+def fetch_database_region(
+    id: str,
+    *,
+    token: Optional[str],
+    environment: str = Environment.PROD,
+    max_time_ms: Optional[int] = None,
+) -> str:
+    """
+    Find the (default) region of a database through the DevOps API.
+    Results are cached in-process, so that only the first lookup for
+    a given database (and token) results in an HTTP request.
+
+    Args:
+        id: e. g. "01234567-89ab-cdef-0123-456789abcdef".
+        token: a valid token to access the database information.
+        environment: one of the Astra DB `astrapy.constants.Environment` values.
+        max_time_ms: a timeout, in milliseconds, for waiting on a response.
+
+    Returns:
+        the region of the database, such as "us-west1".
+    """
+
+    # the cache key holds a digest of the token, never the token itself
+    token_digest = hashlib.blake2b((token or "").encode(), digest_size=16).digest()
+    cache_key = (token_digest, environment, id)
+    cached_entry = _database_region_cache.get(cache_key)
+    if cached_entry is not None:
+        cached_region: str = cached_entry["region"]
+        return cached_region
+
+    logger.info("fetching raw database info for %s", id)
+    this_db_info = fetch_raw_database_info_from_id_token(
+        id=id,
+        token=token,
+        environment=environment,
+        max_time_ms=max_time_ms,
+    )
+    logger.info("finished fetching raw database info for %s", id)
+    region: str = this_db_info["info"]["region"]
+    _database_region_cache.set(cache_key, {"region": region})
+    return region
+
+
 async def async_fetch_raw_database_info_from_id_token(
     id: str,
     *,
@@ -437,15 +489,12 @@ def normalize_api_endpoint(
         if region:
             _region = region
         else:
-            logger.info(f"fetching raw database info for {id_or_endpoint}")
-            this_db_info = fetch_raw_database_info_from_id_token(
+            _region = fetch_database_region(
                 id=id_or_endpoint,
                 token=token.get_token(),
                 environment=environment,
                 max_time_ms=max_time_ms,
             )
-            logger.info(f"finished fetching raw database info for {id_or_endpoint}")
-            _region = this_db_info["info"]["region"]
         _api_endpoint = build_api_endpoint(
             environment=environment,
             database_id=id_or_endpoint,
@@ -14,7 +14,6 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Union, cast
 
 import httpx
@@ -31,6 +30,8 @@ from astrapy.core.defaults import (
 )
 from astrapy.core.utils import (
     TimeoutInfoWideType,
+    decode_json_response,
+    encode_json_payload,
     http_methods,
     log_request,
     log_response,
@@ -75,8 +76,9 @@ def full_user_agent(
 
 
 class APICommander:
-    client = httpx.Client()
-    async_client = httpx.AsyncClient()
+    # HTTP/2, if the server supports it, multiplexes concurrent requests
+    client = httpx.Client(http2=True)
+    async_client = httpx.AsyncClient(http2=True)
 
     def __init__(
         self,
@@ -163,11 +165,7 @@ class APICommander:
             self._loggable_headers,
             normalized_payload,
         )
-        encoded_payload = json.dumps(
-            normalized_payload,
-            allow_nan=False,
-            separators=(",", ":"),
-        ).encode()
+        encoded_payload = encode_json_payload(normalized_payload)
         try:
             raw_response = self.client.request(
                 method=http_method,
@@ -201,11 +199,7 @@ class APICommander:
             self._loggable_headers,
             normalized_payload,
         )
-        encoded_payload = json.dumps(
-            normalized_payload,
-            allow_nan=False,
-            separators=(",", ":"),
-        ).encode()
+        encoded_payload = encode_json_payload(normalized_payload)
         raw_response = await self.async_client.request(
             method=http_method,
             url=self.full_path,
@@ -237,7 +231,7 @@ class APICommander:
         try:
             raw_response_json = cast(
                 Dict[str, Any],
-                raw_response.json(),
+                decode_json_response(raw_response.content),
             )
         except ValueError:
             # json() parsing has failed (e.g., empty body)
@@ -281,7 +275,7 @@ class APICommander:
         try:
             raw_response_json = cast(
                 Dict[str, Any],
-                raw_response.json(),
+                decode_json_response(raw_response.content),
             )
         except ValueError:
             # json() parsing has failed (e.g., empty body)
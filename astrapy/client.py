@@ -22,7 +22,7 @@ from astrapy.admin import (
     api_endpoint_parser,
     build_api_endpoint,
     database_id_matcher,
-    fetch_raw_database_info_from_id_token,
+    fetch_database_region,
     normalize_id_endpoint_parameters,
     parse_api_endpoint,
     parse_generic_api_url,
@@ -289,17 +289,12 @@ class DataAPIClient:
                 if region:
                     _region = region
                 else:
-                    logger.info(f"fetching raw database info for {_id_or_endpoint}")
-                    this_db_info = fetch_raw_database_info_from_id_token(
+                    _region = fetch_database_region(
                         id=_id_or_endpoint,
                         token=self.token_provider.get_token(),
                         environment=self.environment,
                         max_time_ms=max_time_ms,
                     )
-                    logger.info(
-                        f"finished fetching raw database info for {_id_or_endpoint}"
-                    )
-                    _region = this_db_info["info"]["region"]
 
                 _token = coerce_token_provider(token) or self.token_provider
                 _api_endpoint = build_api_endpoint(
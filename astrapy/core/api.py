@@ -15,12 +15,19 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, Optional, Union, cast
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union, cast
 
 import httpx
 
-from astrapy.core.core_types import API_RESPONSE
-from astrapy.core.utils import amake_request, make_request
+from astrapy.core.core_types import API_DOC, API_RESPONSE
+from astrapy.core.defaults import DEFAULT_STREAM_CHUNK_SIZE
+from astrapy.core.utils import (
+    DocumentStreamParser,
+    amake_request,
+    decode_json_response,
+    encode_json_payload,
+    make_request,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +40,9 @@ class APIRequestError(ValueError):
 
         self.response = response
         self.payload = payload
+        # for insertions split into several requests, the (merged) response
+        # from the other requests, i.e. what was inserted nevertheless
+        self.partial_response: Optional[API_RESPONSE] = None
 
     def __repr__(self) -> str:
         return f"{self.response}"
@@ -51,6 +61,8 @@ def raw_api_request(
     caller_version: Optional[str],
     timeout: Optional[Union[httpx.Timeout, float]],
     additional_headers: Dict[str, str],
+    compress: bool = False,
+    stream: bool = False,
 ) -> httpx.Response:
     return make_request(
         client=client,
@@ -65,6 +77,8 @@ def raw_api_request(
         caller_version=caller_version,
         timeout=timeout,
         additional_headers=additional_headers,
+        compress=compress,
+        stream=stream,
     )
 
 
@@ -76,7 +90,9 @@ def process_raw_api_response(
     # In case of other successful responses, parse the JSON body.
     try:
         # Cast the response to the expected type.
-        response_body: API_RESPONSE = cast(API_RESPONSE, raw_response.json())
+        response_body: API_RESPONSE = cast(
+            API_RESPONSE, decode_json_response(raw_response.content)
+        )
 
         # If the API produced an error, warn and raise it as an Exception
         if "errors" in response_body and not skip_error_check:
@@ -105,6 +121,7 @@ def api_request(
     caller_version: Optional[str],
     timeout: Optional[Union[httpx.Timeout, float]],
     additional_headers: Dict[str, str],
+    compress: bool = False,
 ) -> API_RESPONSE:
     raw_response = raw_api_request(
         client=client,
@@ -119,6 +136,7 @@ def api_request(
         caller_version=caller_version,
         timeout=timeout,
         additional_headers=additional_headers,
+        compress=compress,
     )
     raw_response.raise_for_status()
     return process_raw_api_response(
@@ -126,6 +144,69 @@ def api_request(
     )
 
 
+def _streamed_response_error(
+    raw_response: httpx.Response,
+    errors: Optional[List[Dict[str, Any]]],
+    json_data: Optional[Dict[str, Any]],
+) -> APIRequestError:
+    # the body of a streamed response is gone once consumed: rebuild one
+    # with the errors in it (if they could be parsed at all)
+    error_response = httpx.Response(
+        status_code=raw_response.status_code,
+        content=encode_json_payload({"errors": errors}) if errors else b"",
+        request=raw_response.request,
+    )
+    return APIRequestError(error_response, payload=json_data)
+
+
+def api_request_documents(
+    client: httpx.Client,
+    base_url: str,
+    auth_header: str,
+    token: Optional[str],
+    method: str,
+    json_data: Optional[Dict[str, Any]],
+    url_params: Optional[Dict[str, Any]],
+    path: Optional[str],
+    caller_name: Optional[str],
+    caller_version: Optional[str],
+    timeout: Optional[Union[httpx.Timeout, float]],
+    additional_headers: Dict[str, str],
+    compress: bool = False,
+) -> Iterator[API_DOC]:
+    raw_response = raw_api_request(
+        client=client,
+        base_url=base_url,
+        auth_header=auth_header,
+        token=token,
+        method=method,
+        json_data=json_data,
+        url_params=url_params,
+        path=path,
+        caller_name=caller_name,
+        caller_version=caller_version,
+        timeout=timeout,
+        additional_headers=additional_headers,
+        compress=compress,
+        stream=True,
+    )
+    try:
+        raw_response.raise_for_status()
+        parser = DocumentStreamParser()
+        try:
+            for chunk in raw_response.iter_bytes(DEFAULT_STREAM_CHUNK_SIZE):
+                yield from parser.feed(chunk)
+            yield from parser.close()
+        except ValueError:
+            # Handle cases where parsing fails (e.g., empty body)
+            raise _streamed_response_error(raw_response, None, json_data)
+        if parser.errors:
+            logger.debug(parser.errors)
+            raise _streamed_response_error(raw_response, parser.errors, json_data)
+    finally:
+        raw_response.close()
+
+
 ###
 async def async_raw_api_request(
     client: httpx.AsyncClient,
@@ -140,6 +221,8 @@ async def async_raw_api_request(
     caller_version: Optional[str],
     timeout: Optional[Union[httpx.Timeout, float]],
     additional_headers: Dict[str, str],
+    compress: bool = False,
+    stream: bool = False,
 ) -> httpx.Response:
     return await amake_request(
         client=client,
@@ -154,6 +237,8 @@ async def async_raw_api_request(
         caller_version=caller_version,
         timeout=timeout,
         additional_headers=additional_headers,
+        compress=compress,
+        stream=stream,
     )
 
 
@@ -165,7 +250,9 @@ async def async_process_raw_api_response(
     # In case of other successful responses, parse the JSON body.
     try:
         # Cast the response to the expected type.
-        response_body: API_RESPONSE = cast(API_RESPONSE, raw_response.json())
+        response_body: API_RESPONSE = cast(
+            API_RESPONSE, decode_json_response(raw_response.content)
+        )
 
         # If the API produced an error, warn and return the API request error class
         if "errors" in response_body and not skip_error_check:
@@ -194,6 +281,7 @@ async def async_api_request(
     caller_version: Optional[str],
     timeout: Optional[Union[httpx.Timeout, float]],
     additional_headers: Dict[str, str],
+    compress: bool = False,
 ) -> API_RESPONSE:
     raw_response = await async_raw_api_request(
         client=client,
@@ -208,6 +296,7 @@ async def async_api_request(
         caller_version=caller_version,
         timeout=timeout,
         additional_headers=additional_headers,
+        compress=compress,
     )
     raw_response.raise_for_status()
     return await async_process_raw_api_response(
@@ -215,3 +304,53 @@ async def async_api_request(
         skip_error_check=skip_error_check,
         json_data=json_data,
     )
+
+
+async def async_api_request_documents(
+    client: httpx.AsyncClient,
+    base_url: str,
+    auth_header: str,
+    token: Optional[str],
+    method: str,
+    json_data: Optional[Dict[str, Any]],
+    url_params: Optional[Dict[str, Any]],
+    path: Optional[str],
+    caller_name: Optional[str],
+    caller_version: Optional[str],
+    timeout: Optional[Union[httpx.Timeout, float]],
+    additional_headers: Dict[str, str],
+    compress: bool = False,
+) -> AsyncIterator[API_DOC]:
+    raw_response = await async_raw_api_request(
+        client=client,
+        base_url=base_url,
+        auth_header=auth_header,
+        token=token,
+        method=method,
+        json_data=json_data,
+        url_params=url_params,
+        path=path,
+        caller_name=caller_name,
+        caller_version=caller_version,
+        timeout=timeout,
+        additional_headers=additional_headers,
+        compress=compress,
+        stream=True,
+    )
+    try:
+        raw_response.raise_for_status()
+        parser = DocumentStreamParser()
+        try:
+            async for chunk in raw_response.aiter_bytes(DEFAULT_STREAM_CHUNK_SIZE):
+                for document in parser.feed(chunk):
+                    yield document
+            for document in parser.close():
+                yield document
+        except ValueError:
+            # Handle cases where parsing fails (e.g., empty body)
+            raise _streamed_response_error(raw_response, None, json_data)
+        if parser.errors:
+            logger.debug(parser.errors)
+            raise _streamed_response_error(raw_response, parser.errors, json_data)
+    finally:
+        await raw_response.aclose()
@@ -23,11 +23,34 @@ from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from queue import Queue
 from types import TracebackType
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 import httpx
 
-from astrapy.core.api import APIRequestError, api_request, async_api_request
+from astrapy.core.api import (
+    APIRequestError,
+    api_request,
+    api_request_documents,
+    async_api_request,
+    async_api_request_documents,
+    async_process_raw_api_response,
+    async_raw_api_request,
+    process_raw_api_response,
+    raw_api_request,
+)
 from astrapy.core.core_types import (
     API_DOC,
     API_RESPONSE,
@@ -36,28 +59,107 @@ from astrapy.core.core_types import (
 )
 from astrapy.core.defaults import (
     DEFAULT_AUTH_HEADER,
+    DEFAULT_FIND_PIPELINED_CONCURRENCY,
+    DEFAULT_HTTP_CONNECT_RETRIES,
+    DEFAULT_HTTP_MAX_CONNECTIONS,
+    DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_INSERT_MANY_CONCURRENCY,
     DEFAULT_INSERT_NUM_DOCUMENTS,
     DEFAULT_JSON_API_PATH,
     DEFAULT_JSON_API_VERSION,
     DEFAULT_KEYSPACE_NAME,
+    MAX_INSERT_NUM_DOCUMENTS,
 )
 from astrapy.core.utils import (
+    ResponseCache,
     TimeoutInfoWideType,
     convert_vector_to_floats,
     http_methods,
     make_payload,
     normalize_for_api,
+    response_cache_key,
     restore_from_api,
     to_httpx_timeout,
 )
 
+if TYPE_CHECKING:
+    from astrapy.core.typed_responses import FindOneResponse, FindResponse
+
 logger = logging.getLogger(__name__)
 
 
-class AstraDBCollection:
-    # Initialize the shared httpx client as a class attribute
-    client = httpx.Client()
+def _make_http_limits(max_pool_size: Optional[int]) -> httpx.Limits:
+    if max_pool_size is None:
+        return httpx.Limits(
+            max_connections=DEFAULT_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        )
+    return httpx.Limits(
+        max_connections=max_pool_size, max_keepalive_connections=max_pool_size
+    )
+
+
+def _make_http_client(max_pool_size: Optional[int] = None) -> httpx.Client:
+    """
+    Create an httpx client for AstraDB instances and their collections:
+    being a single connection pool, keep-alive connections get reused across calls.
+    HTTP/2 is negotiated when available, so that concurrent requests to the same
+    host get multiplexed over one connection.
+    Connection failures (not the requests themselves) are retried a few times.
+    """
+    return httpx.Client(
+        transport=httpx.HTTPTransport(
+            http2=True,
+            limits=_make_http_limits(max_pool_size),
+            retries=DEFAULT_HTTP_CONNECT_RETRIES,
+        ),
+    )
+
+
+class _NotSet:
+    """The type of `_NOT_SET`, default of `copy` parameters for which None means off."""
+
+
+_NOT_SET = _NotSet()
+
+
+def _merge_insert_many_responses(
+    responses: List[Union[API_RESPONSE, APIRequestError]],
+    partial_failures_allowed: bool,
+) -> API_RESPONSE:
+    """
+    Collate the responses from several chunked "insertMany" requests into
+    a single response with the same shape as that of a non-chunked request.
+    A chunk that failed altogether contributes an entry to the "errors" if
+    partial failures are allowed; otherwise the (first) exception is raised,
+    with the merged response of the other chunks as its `partial_response`.
+    """
+    inserted_ids: List[Any] = []
+    errors: List[Any] = []
+    exceptions: List[APIRequestError] = []
+    for response in responses:
+        if isinstance(response, APIRequestError):
+            exceptions.append(response)
+            errors.append({"message": str(response)})
+        else:
+            inserted_ids += response.get("status", {}).get("insertedIds", [])
+            errors += response.get("errors", [])
+    merged: API_RESPONSE = {"status": {"insertedIds": inserted_ids}}
+    if exceptions and not partial_failures_allowed:
+        exceptions[0].partial_response = merged
+        raise exceptions[0]
+    if errors:
+        merged["errors"] = errors
+    return merged
+
 
+def _is_failed_insert_many_response(
+    response: Union[API_RESPONSE, APIRequestError]
+) -> bool:
+    return isinstance(response, APIRequestError) or "errors" in response
+
+
+class AstraDBCollection:
     def __init__(
         self,
         collection_name: str,
@@ -68,6 +170,7 @@ class AstraDBCollection:
         caller_name: Optional[str] = None,
         caller_version: Optional[str] = None,
         additional_headers: Dict[str, str] = {},
+        cache_ttl: Optional[float] = None,
     ) -> None:
         """
         Initialize an AstraDBCollection instance.
@@ -85,6 +188,10 @@ class AstraDBCollection:
             additional_headers (Dict[str, str]): any further set of headers,
                 in the form of key-value pairs, to be passed with the HTTP
                 requests by this collection instance.
+            cache_ttl (float, optional): if provided, the responses to `find_one`
+                and `get` are cached in-process for this many seconds. The whole
+                cache is dropped whenever any other request is issued through
+                this collection instance. Default is no caching.
         """
         # Check for presence of the Astra DB object
         if astra_db is None:
@@ -113,8 +220,18 @@ class AstraDBCollection:
         self.caller_name: Optional[str] = self.astra_db.caller_name
         self.caller_version: Optional[str] = self.astra_db.caller_version
         self.additional_headers = additional_headers
+        self.cache_ttl = cache_ttl
+        self._response_cache = (
+            ResponseCache(ttl=cache_ttl) if cache_ttl is not None else None
+        )
+        # ETag validators of GET responses, for conditional re-fetching
+        self._etag_cache = (
+            ResponseCache(ttl=float("inf")) if cache_ttl is not None else None
+        )
+        self.client = astra_db.client
         self.collection_name = collection_name
         self.base_path: str = f"{self.astra_db.base_path}/{self.collection_name}"
+        self._base_path_slash = self.base_path + "/"
 
     def __repr__(self) -> str:
         return f'AstraDBCollection[astra_db="{self.astra_db}", collection_name="{self.collection_name}"]'
@@ -128,6 +245,7 @@ class AstraDBCollection:
                     self.caller_name == other.caller_name,
                     self.caller_version == other.caller_version,
                     self.additional_headers == other.additional_headers,
+                    self.cache_ttl == other.cache_ttl,
                 ]
             )
         else:
@@ -145,6 +263,7 @@ class AstraDBCollection:
         caller_name: Optional[str] = None,
         caller_version: Optional[str] = None,
         additional_headers: Optional[Dict[str, str]] = None,
+        cache_ttl: Union[float, None, _NotSet] = _NOT_SET,
     ) -> AstraDBCollection:
         return AstraDBCollection(
             collection_name=collection_name or self.collection_name,
@@ -160,6 +279,7 @@ class AstraDBCollection:
             caller_name=caller_name or self.caller_name,
             caller_version=caller_version or self.caller_version,
             additional_headers=additional_headers or self.additional_headers,
+            cache_ttl=self.cache_ttl if isinstance(cache_ttl, _NotSet) else cache_ttl,
         )
 
     def to_async(self) -> AsyncAstraDBCollection:
@@ -169,6 +289,7 @@ class AstraDBCollection:
             caller_name=self.caller_name,
             caller_version=self.caller_version,
             additional_headers=self.additional_headers,
+            cache_ttl=self.cache_ttl,
         )
 
     def set_caller(
@@ -191,14 +312,39 @@ class AstraDBCollection:
         url_params: Optional[Dict[str, Any]] = None,
         skip_error_check: bool = False,
         timeout_info: TimeoutInfoWideType = None,
+        use_cache: bool = False,
     ) -> API_RESPONSE:
+        normalized_json_data = normalize_for_api(json_data)
+        if self._response_cache is not None:
+            if use_cache:
+                cache_key = response_cache_key(
+                    method, path, normalized_json_data, url_params
+                )
+                cached_response = self._response_cache.get(cache_key)
+                if cached_response is not None:
+                    return cached_response
+                cache_generation = self._response_cache.generation
+                if method == http_methods.GET:
+                    response = self._conditional_get(
+                        path=path,
+                        url_params=url_params,
+                        cache_key=cache_key,
+                        timeout_info=timeout_info,
+                    )
+                    self._response_cache.set(
+                        cache_key, response, generation=cache_generation
+                    )
+                    return response
+            else:
+                # this might be a write: no cached response can be trusted anymore
+                self.invalidate_cache()
         direct_response = api_request(
             client=self.client,
             base_url=self.astra_db.base_url,
             auth_header=DEFAULT_AUTH_HEADER,
             token=self.astra_db.token,
             method=method,
-            json_data=normalize_for_api(json_data),
+            json_data=normalized_json_data,
             url_params=url_params,
             path=path,
             skip_error_check=skip_error_check,
@@ -206,17 +352,86 @@ class AstraDBCollection:
             caller_version=self.caller_version,
             timeout=to_httpx_timeout(timeout_info),
             additional_headers=self.additional_headers,
+            compress=self.astra_db.compress,
         )
         response = restore_from_api(direct_response)
+        if use_cache and self._response_cache is not None:
+            self._response_cache.set(cache_key, response, generation=cache_generation)
+        return response
+
+    def _conditional_get(
+        self,
+        path: Optional[str],
+        url_params: Optional[Dict[str, Any]],
+        cache_key: Hashable,
+        timeout_info: TimeoutInfoWideType,
+    ) -> API_RESPONSE:
+        """
+        Issue a GET request, revalidating the last response to it, if it came
+        with an ETag: a "304 Not Modified" answer means it is still current.
+        """
+        validator = (
+            self._etag_cache.get(cache_key) if self._etag_cache is not None else None
+        )
+        etag_generation = (
+            self._etag_cache.generation if self._etag_cache is not None else None
+        )
+        additional_headers = self.additional_headers
+        if validator is not None:
+            additional_headers = {
+                **additional_headers,
+                "If-None-Match": validator["etag"],
+            }
+        raw_response = raw_api_request(
+            client=self.client,
+            base_url=self.astra_db.base_url,
+            auth_header=DEFAULT_AUTH_HEADER,
+            token=self.astra_db.token,
+            method=http_methods.GET,
+            json_data=None,
+            url_params=url_params,
+            path=path,
+            caller_name=self.caller_name,
+            caller_version=self.caller_version,
+            timeout=to_httpx_timeout(timeout_info),
+            additional_headers=additional_headers,
+        )
+        if (
+            validator is not None
+            and raw_response.status_code == httpx.codes.NOT_MODIFIED
+        ):
+            return cast(API_RESPONSE, validator["response"])
+        raw_response.raise_for_status()
+        response = restore_from_api(
+            process_raw_api_response(
+                raw_response, skip_error_check=False, json_data=None
+            )
+        )
+        etag = raw_response.headers.get("ETag")
+        if etag is not None and self._etag_cache is not None:
+            self._etag_cache.set(
+                cache_key,
+                {"etag": etag, "response": response},
+                generation=etag_generation,
+            )
         return response
 
+    def invalidate_cache(self) -> None:
+        """
+        Drop all responses cached by this collection (see the `cache_ttl`
+        parameter), so that the next reads are answered by the API.
+        This happens automatically for any request other than a cached read.
+        """
+        if self._response_cache is not None:
+            self._response_cache.clear()
+        if self._etag_cache is not None:
+            self._etag_cache.clear()
+
     def post_raw_request(
         self, body: Dict[str, Any], timeout_info: TimeoutInfoWideType = None
     ) -> API_RESPONSE:
-        return self._request(
-            method=http_methods.POST,
-            path=self.base_path,
-            json_data=body,
+        return self._post(
+            document=body,
             timeout_info=timeout_info,
         )
 
@@ -226,12 +441,13 @@ class AstraDBCollection:
         options: Optional[Dict[str, Any]] = None,
         timeout_info: TimeoutInfoWideType = None,
     ) -> Optional[API_RESPONSE]:
-        full_path = f"{self.base_path}/{path}" if path else self.base_path
+        full_path = self._base_path_slash + path if path else self.base_path
         response = self._request(
             method=http_methods.GET,
             path=full_path,
             url_params=options,
             timeout_info=timeout_info,
+            use_cache=True,
         )
         if isinstance(response, dict):
             return response
@@ -243,7 +459,7 @@ class AstraDBCollection:
         document: Optional[API_RESPONSE] = None,
         timeout_info: TimeoutInfoWideType = None,
     ) -> API_RESPONSE:
-        full_path = f"{self.base_path}/{path}" if path else self.base_path
+        full_path = self._base_path_slash + path if path else self.base_path
         response = self._request(
             method=http_methods.PUT,
             path=full_path,
@@ -257,13 +473,17 @@ class AstraDBCollection:
         path: Optional[str] = None,
         document: Optional[API_DOC] = None,
         timeout_info: TimeoutInfoWideType = None,
+        skip_error_check: bool = False,
+        use_cache: bool = False,
     ) -> API_RESPONSE:
-        full_path = f"{self.base_path}/{path}" if path else self.base_path
+        full_path = self._base_path_slash + path if path else self.base_path
         response = self._request(
             method=http_methods.POST,
             path=full_path,
             json_data=document,
+            skip_error_check=skip_error_check,
             timeout_info=timeout_info,
+            use_cache=use_cache,
         )
         return response
 
@@ -512,6 +732,212 @@ class AstraDBCollection:
             raw_response_callback=raw_response_callback,
         )
 
+    def find_pipelined(
+        self,
+        filters: List[Dict[str, Any]],
+        projection: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, Any]] = None,
+        options: Optional[Dict[str, Any]] = None,
+        concurrency: int = DEFAULT_FIND_PIPELINED_CONCURRENCY,
+        timeout_info: TimeoutInfoWideType = None,
+    ) -> List[API_RESPONSE]:
+        """
+        Run several independent `find` queries, one per filter, concurrently.
+
+        Args:
+            filters (list): A list of filters, each resulting in a `find` call.
+            projection (dict, optional): Specifies the fields to return.
+            sort (dict, optional): Specifies the order in which to return matching documents.
+            options (dict, optional): Additional options for the queries.
+            concurrency (int, optional): The maximum number of queries in flight
+                at any given time.
+            timeout_info: a float, or a TimeoutInfo dict, for each single HTTP request.
+                Note that a 'read' timeout event will not block the action taken
+                by the API server if it has received the request already.
+
+        Returns:
+            list: The query responses, in the same order as the input filters.
+        """
+        partialed_find = partial(
+            self.find,
+            projection=projection,
+            sort=sort,
+            options=options,
+            timeout_info=timeout_info,
+        )
+
+        # If we have concurrency as 1, don't use a thread pool
+        if concurrency == 1:
+            return [partialed_find(filter=filter) for filter in filters]
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(
+                executor.map(lambda filter: partialed_find(filter=filter), filters)
+            )
+
+    def find_stream(
+        self,
+        filter: Optional[Dict[str, Any]] = None,
+        projection: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, Any]] = None,
+        options: Optional[Dict[str, Any]] = None,
+        timeout_info: TimeoutInfoWideType = None,
+    ) -> Iterator[API_DOC]:
+        """
+        Find documents in the collection, yielding each of them as soon as
+        it is received, rather than waiting for (and holding in memory)
+        the whole response. This is most useful with large result pages.
+        Incremental parsing requires the optional `ijson` package: without it,
+        documents are yielded only once the full response has been read.
+        No pagination is performed: only the first page of results is returned.
+
+        Args:
+            filter (dict, optional): Criteria to filter documents.
+            projection (dict, optional): Specifies the fields to return.
+            sort (dict, optional): Specifies the order in which to return matching documents.
+            options (dict, optional): Additional options for the query.
+            timeout_info: a float, or a TimeoutInfo dict, for the HTTP request.
+                Note that a 'read' timeout event will not block the action taken
+                by the API server if it has received the request already.
+
+        Returns:
+            Iterator: the documents matching the query, one at a time.
+        """
+        json_query = make_payload(
+            top_level="find",
+            filter=filter,
+            projection=projection,
+            options=options,
+            sort=sort,
+        )
+
+        for document in api_request_documents(
+            client=self.client,
+            base_url=self.astra_db.base_url,
+            auth_header=DEFAULT_AUTH_HEADER,
+            token=self.astra_db.token,
+            method=http_methods.POST,
+            json_data=normalize_for_api(json_query),
+            url_params=None,
+            path=self.base_path,
+            caller_name=self.caller_name,
+            caller_version=self.caller_version,
+            timeout=to_httpx_timeout(timeout_info),
+            additional_headers=self.additional_headers,
+            compress=self.astra_db.compress,
+        ):
+            yield restore_from_api(document)
+
+    def find_typed(
+        self,
+        filter: Optional[Dict[str, Any]] = None,
+        projection: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, Any]] = None,
+        options: Optional[Dict[str, Any]] = None,
+        timeout_info: TimeoutInfoWideType = None,
+    ) -> FindResponse:
+        """
+        Find documents in the collection, returning a typed response.
+        The response body is decoded directly into a `FindResponse` struct,
+        with attribute access to its parts, instead of a dictionary.
+        Requires the optional `msgspec` package.
+
+        Args:
+            filter (dict, optional): Criteria to filter documents.
+            projection (dict, optional): Specifies the fields to return.
+            sort (dict, optional): Specifies the order in which to return matching documents.
+            options (dict, optional): Additional options for the query.
+            timeout_info: a float, or a TimeoutInfo dict, for the HTTP request.
+                Note that a 'read' timeout event will not block the action taken
+                by the API server if it has received the request already.
+
+        Returns:
+            FindResponse: the response, in typed form.
+        """
+        from astrapy.core.typed_responses import FindResponse, decode_typed_response
+
+        json_query = make_payload(
+            top_level="find",
+            filter=filter,
+            projection=projection,
+            options=options,
+            sort=sort,
+        )
+        normalized_query = normalize_for_api(json_query)
+
+        raw_response = raw_api_request(
+            client=self.client,
+            base_url=self.astra_db.base_url,
+            auth_header=DEFAULT_AUTH_HEADER,
+            token=self.astra_db.token,
+            method=http_methods.POST,
+            json_data=normalized_query,
+            url_params=None,
+            path=self.base_path,
+            caller_name=self.caller_name,
+            caller_version=self.caller_version,
+            timeout=to_httpx_timeout(timeout_info),
+            additional_headers=self.additional_headers,
+            compress=self.astra_db.compress,
+        )
+        raw_response.raise_for_status()
+        return decode_typed_response(raw_response, FindResponse, normalized_query)
+
+    def find_one_typed(
+        self,
+        filter: Optional[Dict[str, Any]] = None,
+        projection: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, Any]] = None,
+        options: Optional[Dict[str, Any]] = None,
+        timeout_info: TimeoutInfoWideType = None,
+    ) -> FindOneResponse:
+        """
+        Find a single document in the collection, returning a typed response.
+        The response body is decoded directly into a `FindOneResponse` struct,
+        with attribute access to its parts, instead of a dictionary.
+        Requires the optional `msgspec` package.
+
+        Args:
+            filter (dict, optional): Criteria to filter documents.
+            projection (dict, optional): Specifies the fields to return.
+            sort (dict, optional): Specifies the order in which to return the document.
+            options (dict, optional): Additional options for the query.
+            timeout_info: a float, or a TimeoutInfo dict, for the HTTP request.
+                Note that a 'read' timeout event will not block the action taken
+                by the API server if it has received the request already.
+
+        Returns:
+            FindOneResponse: the response, in typed form.
+        """
+        from astrapy.core.typed_responses import FindOneResponse, decode_typed_response
+
+        json_query = make_payload(
+            top_level="findOne",
+            filter=filter,
+            projection=projection,
+            options=options,
+            sort=sort,
+        )
+        normalized_query = normalize_for_api(json_query)
+
+        raw_response = raw_api_request(
+            client=self.client,
+            base_url=self.astra_db.base_url,
+            auth_header=DEFAULT_AUTH_HEADER,
+            token=self.astra_db.token,
+            method=http_methods.POST,
+            json_data=normalized_query,
+            url_params=None,
+            path=self.base_path,
+            caller_name=self.caller_name,
+            caller_version=self.caller_version,
+            timeout=to_httpx_timeout(timeout_info),
+            additional_headers=self.additional_headers,
+            compress=self.astra_db.compress,
+        )
+        raw_response.raise_for_status()
+        return decode_typed_response(raw_response, FindOneResponse, normalized_query)
+
     def pop(
         self,
         filter: Dict[str, Any],
@@ -540,10 +966,8 @@ class AstraDBCollection:
             options=options,
         )
 
-        response = self._request(
-            method=http_methods.POST,
-            path=self.base_path,
-            json_data=json_query,
+        response = self._post(
+            document=json_query,
             timeout_info=timeout_info,
         )
 
@@ -577,10 +1001,8 @@ class AstraDBCollection:
             options=options,
         )
 
-        response = self._request(
-            method=http_methods.POST,
-            path=self.base_path,
-            json_data=json_query,
+        response = self._post(
+            document=json_query,
             timeout_info=timeout_info,
         )
 
@@ -620,10 +1042,8 @@ class AstraDBCollection:
             sort=sort,
         )
 
-        response = self._request(
-            method=http_methods.POST,
-            path=f"{self.base_path}",
-            json_data=json_query,
+        response = self._post(
+            document=json_query,
             timeout_info=timeout_info,
         )
 
@@ -703,10 +1123,8 @@ class AstraDBCollection:
             projection=projection,
         )
 
-        response = self._request(
-            method=http_methods.POST,
-            path=f"{self.base_path}",
-            json_data=json_query,
+        response = self._post(
+            document=json_query,
             timeout_info=timeout_info,
         )
 
@@ -782,10 +1200,8 @@ class AstraDBCollection:
             projection=projection,
         )
 
-        response = self._request(
-            method=http_methods.POST,
-            path=f"{self.base_path}",
-            json_data=json_query,
+        response = self._post(
+            document=json_query,
             timeout_info=timeout_info,
         )
 
@@ -820,10 +1236,10 @@ class AstraDBCollection:
 
     def find_one(
         self,
-        filter: Optional[Dict[str, Any]] = {},
-        projection: Optional[Dict[str, Any]] = {},
-        sort: Optional[Dict[str, Any]] = {},
-        options: Optional[Dict[str, Any]] = {},
+        filter: Optional[Dict[str, Any]] = None,
+        projection: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, Any]] = None,
+        options: Optional[Dict[str, Any]] = None,
         timeout_info: TimeoutInfoWideType = None,
     ) -> API_RESPONSE:
         """
@@ -853,7 +1269,11 @@ class AstraDBCollection:
             sort=sort,
         )
 
-        response = self._post(document=json_query, timeout_info=timeout_info)
+        response = self._post(
+            document=json_query,
+            timeout_info=timeout_info,
+            use_cache=True,
+        )
 
         return response
 
@@ -903,6 +1323,7 @@ class AstraDBCollection:
         document: API_DOC,
         failures_allowed: bool = False,
         timeout_info: TimeoutInfoWideType = None,
+        vector: Optional[Iterable[float]] = None,
     ) -> API_RESPONSE:
         """
         Insert a single document into the collection.
@@ -913,16 +1334,20 @@ class AstraDBCollection:
             timeout_info: a float, or a TimeoutInfo dict, for the HTTP request.
                 Note that a 'read' timeout event will not block the action taken
                 by the API server if it has received the request already.
+            vector (Iterable[float], optional): a vector to store as the "$vector"
+                of the document (the passed document is not modified).
+                One-dimensional numpy float arrays are written without conversion
+                to a list of floats if `orjson` is installed.
 
         Returns:
             dict: The response from the database after the insert operation.
         """
-        json_query = make_payload(top_level="insertOne", document=document)
+        if vector is not None:
+            document = {**document, "$vector": vector}
+        json_query = {"insertOne": {"document": document}}
 
-        response = self._request(
-            method=http_methods.POST,
-            path=self.base_path,
-            json_data=json_query,
+        response = self._post(
+            document=json_query,
             skip_error_check=failures_allowed,
             timeout_info=timeout_info,
         )
@@ -938,6 +1363,10 @@ class AstraDBCollection:
     ) -> API_RESPONSE:
         """
         Insert multiple documents into the collection.
+        Lists longer than what the API accepts in a single request are
+        transparently split into chunks, inserted concurrently (sequentially
+        if the insertion is ordered, stopping at the first chunk with errors),
+        and the responses merged into one.
 
         Args:
             documents (list): A list of documents to insert.
@@ -947,19 +1376,53 @@ class AstraDBCollection:
             timeout_info: a float, or a TimeoutInfo dict, for the HTTP request.
                 Note that a 'read' timeout event will not block the action taken
                 by the API server if it has received the request already.
+                For lists that get chunked, this applies to each request.
 
         Returns:
             dict: The response from the database after the insert operation.
         """
+        if len(documents) > MAX_INSERT_NUM_DOCUMENTS:
+
+            def _insert_chunk(
+                chunk: List[API_DOC],
+            ) -> Union[API_RESPONSE, APIRequestError]:
+                try:
+                    return self.insert_many(
+                        chunk,
+                        options,
+                        partial_failures_allowed,
+                        timeout_info=timeout_info,
+                    )
+                except APIRequestError as e:
+                    return e
+
+            chunks = [
+                documents[i : i + DEFAULT_INSERT_NUM_DOCUMENTS]
+                for i in range(0, len(documents), DEFAULT_INSERT_NUM_DOCUMENTS)
+            ]
+            chunk_responses: List[Union[API_RESPONSE, APIRequestError]] = []
+            if (options or {}).get("ordered"):
+                # one chunk at a time, stopping at the first one with errors
+                for chunk in chunks:
+                    chunk_responses.append(_insert_chunk(chunk))
+                    if _is_failed_insert_many_response(chunk_responses[-1]):
+                        break
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=DEFAULT_INSERT_MANY_CONCURRENCY
+                ) as executor:
+                    chunk_responses = list(executor.map(_insert_chunk, chunks))
+            return _merge_insert_many_responses(
+                chunk_responses, partial_failures_allowed
+            )
+
         json_query = make_payload(
             top_level="insertMany", documents=documents, options=options
         )
 
         # Send the data
-        response = self._request(
-            method=http_methods.POST,
-            path=f"{self.base_path}",
-            json_data=json_query,
+        response = self._post(
+            document=json_query,
             skip_error_check=partial_failures_allowed,
             timeout_info=timeout_info,
         )
@@ -1080,10 +1543,8 @@ class AstraDBCollection:
             sort=sort,
         )
 
-        response = self._request(
-            method=http_methods.POST,
-            path=f"{self.base_path}",
-            json_data=json_query,
+        response = self._post(
+            document=json_query,
             timeout_info=timeout_info,
         )
 
@@ -1116,10 +1577,8 @@ class AstraDBCollection:
             options=options,
         )
 
-        response = self._request(
-            method=http_methods.POST,
-            path=f"{self.base_path}",
-            json_data=json_query,
+        response = self._post(
+            document=json_query,
             timeout_info=timeout_info,
         )
 
@@ -1161,16 +1620,13 @@ class AstraDBCollection:
         Returns:
             dict: The response from the database after the delete operation.
         """
-        json_query = make_payload(
-            top_level="deleteOne",
-            filter={"_id": id},
-            sort=sort,
-        )
+        delete_one: Dict[str, Any] = {"filter": {"_id": id}}
+        if sort is not None:
+            delete_one["sort"] = sort
+        json_query = {"deleteOne": delete_one}
 
-        response = self._request(
-            method=http_methods.POST,
-            path=f"{self.base_path}",
-            json_data=json_query,
+        response = self._post(
+            document=json_query,
             timeout_info=timeout_info,
         )
 
@@ -1200,10 +1656,8 @@ class AstraDBCollection:
             sort=sort,
         )
 
-        response = self._request(
-            method=http_methods.POST,
-            path=f"{self.base_path}",
-            json_data=json_query,
+        response = self._post(
+            document=json_query,
             timeout_info=timeout_info,
         )
 
@@ -1235,10 +1689,8 @@ class AstraDBCollection:
             }
         }
 
-        response = self._request(
-            method=http_methods.POST,
-            path=f"{self.base_path}",
-            json_data=json_query,
+        response = self._post(
+            document=json_query,
             skip_error_check=skip_error_check,
             timeout_info=timeout_info,
         )
@@ -1315,10 +1767,8 @@ class AstraDBCollection:
             }
         }
 
-        response = self._request(
-            method=http_methods.POST,
-            path=f"{self.base_path}",
-            json_data=json_query,
+        response = self._post(
+            document=json_query,
             timeout_info=timeout_info,
         )
 
@@ -1442,6 +1892,7 @@ class AsyncAstraDBCollection:
         caller_name: Optional[str] = None,
         caller_version: Optional[str] = None,
         additional_headers: Dict[str, str] = {},
+        cache_ttl: Optional[float] = None,
     ) -> None:
         """
         Initialize an AstraDBCollection instance.
@@ -1459,6 +1910,10 @@ class AsyncAstraDBCollection:
             additional_headers (Dict[str, str]): any further set of headers,
                 in the form of key-value pairs, to be passed with the HTTP
                 requests by this collection instance.
+            cache_ttl (float, optional): if provided, the responses to `find_one`
+                and `get` are cached in-process for this many seconds. The whole
+                cache is dropped whenever any other request is issued through
+                this collection instance. Default is no caching.
         """
         # Check for presence of the Astra DB object
         if astra_db is None:
@@ -1487,9 +1942,21 @@ class AsyncAstraDBCollection:
         self.caller_name: Optional[str] = self.astra_db.caller_name
         self.caller_version: Optional[str] = self.astra_db.caller_version
         self.additional_headers = additional_headers
-        self.client = astra_db.client
+        self.cache_ttl = cache_ttl
+        self._response_cache = (
+            ResponseCache(ttl=cache_ttl) if cache_ttl is not None else None
+        )
+        # ETag validators of GET responses, for conditional re-fetching
+        self._etag_cache = (
+            ResponseCache(ttl=float("inf")) if cache_ttl is not None else None
+        )
         self.collection_name = collection_name
         self.base_path: str = f"{self.astra_db.base_path}/{self.collection_name}"
+        self._base_path_slash = self.base_path + "/"
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self.astra_db.client
 
     def __repr__(self) -> str:
         return f'AsyncAstraDBCollection[astra_db="{self.astra_db}", collection_name="{self.collection_name}"]'
@@ -1503,6 +1970,7 @@ class AsyncAstraDBCollection:
                     self.caller_name == other.caller_name,
                     self.caller_version == other.caller_version,
                     self.additional_headers == other.additional_headers,
+                    self.cache_ttl == other.cache_ttl,
                 ]
             )
         else:
@@ -1520,6 +1988,7 @@ class AsyncAstraDBCollection:
         caller_name: Optional[str] = None,
         caller_version: Optional[str] = None,
         additional_headers: Optional[Dict[str, str]] = None,
+        cache_ttl: Union[float, None, _NotSet] = _NOT_SET,
     ) -> AsyncAstraDBCollection:
         return AsyncAstraDBCollection(
             collection_name=collection_name or self.collection_name,
@@ -1535,6 +2004,7 @@ class AsyncAstraDBCollection:
             caller_name=caller_name or self.caller_name,
             caller_version=caller_version or self.caller_version,
             additional_headers=additional_headers or self.additional_headers,
+            cache_ttl=self.cache_ttl if isinstance(cache_ttl, _NotSet) else cache_ttl,
         )
 
     def set_caller(
@@ -1556,6 +2026,7 @@ class AsyncAstraDBCollection:
             caller_name=self.caller_name,
             caller_version=self.caller_version,
             additional_headers=self.additional_headers,
+            cache_ttl=self.cache_ttl,
         )
 
     async def _request(
@@ -1566,15 +2037,40 @@ class AsyncAstraDBCollection:
         url_params: Optional[Dict[str, Any]] = None,
         skip_error_check: bool = False,
         timeout_info: TimeoutInfoWideType = None,
+        use_cache: bool = False,
         **kwargs: Any,
     ) -> API_RESPONSE:
+        normalized_json_data = normalize_for_api(json_data)
+        if self._response_cache is not None:
+            if use_cache:
+                cache_key = response_cache_key(
+                    method, path, normalized_json_data, url_params
+                )
+                cached_response = self._response_cache.get(cache_key)
+                if cached_response is not None:
+                    return cached_response
+                cache_generation = self._response_cache.generation
+                if method == http_methods.GET:
+                    response = await self._conditional_get(
+                        path=path,
+                        url_params=url_params,
+                        cache_key=cache_key,
+                        timeout_info=timeout_info,
+                    )
+                    self._response_cache.set(
+                        cache_key, response, generation=cache_generation
+                    )
+                    return response
+            else:
+                # this might be a write: no cached response can be trusted anymore
+                self.invalidate_cache()
         adirect_response = await async_api_request(
             client=self.client,
             base_url=self.astra_db.base_url,
             auth_header=DEFAULT_AUTH_HEADER,
             token=self.astra_db.token,
             method=method,
-            json_data=normalize_for_api(json_data),
+            json_data=normalized_json_data,
             url_params=url_params,
             path=path,
             skip_error_check=skip_error_check,
@@ -1582,17 +2078,86 @@ class AsyncAstraDBCollection:
             caller_version=self.caller_version,
             timeout=to_httpx_timeout(timeout_info),
             additional_headers=self.additional_headers,
+            compress=self.astra_db.compress,
         )
         response = restore_from_api(adirect_response)
+        if use_cache and self._response_cache is not None:
+            self._response_cache.set(cache_key, response, generation=cache_generation)
         return response
 
+    async def _conditional_get(
+        self,
+        path: Optional[str],
+        url_params: Optional[Dict[str, Any]],
+        cache_key: Hashable,
+        timeout_info: TimeoutInfoWideType,
+    ) -> API_RESPONSE:
+        """
+        Issue a GET request, revalidating the last response to it, if it came
+        with an ETag: a "304 Not Modified" answer means it is still current.
+        """
+        validator = (
+            self._etag_cache.get(cache_key) if self._etag_cache is not None else None
+        )
+        etag_generation = (
+            self._etag_cache.generation if self._etag_cache is not None else None
+        )
+        additional_headers = self.additional_headers
+        if validator is not None:
+            additional_headers = {
+                **additional_headers,
+                "If-None-Match": validator["etag"],
+            }
+        raw_response = await async_raw_api_request(
+            client=self.client,
+            base_url=self.astra_db.base_url,
+            auth_header=DEFAULT_AUTH_HEADER,
+            token=self.astra_db.token,
+            method=http_methods.GET,
+            json_data=None,
+            url_params=url_params,
+            path=path,
+            caller_name=self.caller_name,
+            caller_version=self.caller_version,
+            timeout=to_httpx_timeout(timeout_info),
+            additional_headers=additional_headers,
+        )
+        if (
+            validator is not None
+            and raw_response.status_code == httpx.codes.NOT_MODIFIED
+        ):
+            return cast(API_RESPONSE, validator["response"])
+        raw_response.raise_for_status()
+        response = restore_from_api(
+            await async_process_raw_api_response(
+                raw_response, skip_error_check=False, json_data=None
+            )
+        )
+        etag = raw_response.headers.get("ETag")
+        if etag is not None and self._etag_cache is not None:
+            self._etag_cache.set(
+                cache_key,
+                {"etag": etag, "response": response},
+                generation=etag_generation,
+            )
+        return response
+
+    def invalidate_cache(self) -> None:
+        """
+        Drop all responses cached by this collection (see the `cache_ttl`
+        parameter), so that the next reads are answered by the API.
+        This happens automatically for any request other than a cached read.
+        """
+        if self._response_cache is not None:
+            self._response_cache.clear()
+        if self._etag_cache is not None:
+            self._etag_cache.clear()
+
     async def post_raw_request(
         self, body: Dict[str, Any], timeout_info: TimeoutInfoWideType = None
     ) -> API_RESPONSE:
-        return await self._request(
-            method=http_methods.POST,
-            path=self.base_path,
-            json_data=body,
+        return await self._post(
+            document=body,
             timeout_info=timeout_info,
         )
 
@@ -1602,12 +2167,13 @@ class AsyncAstraDBCollection:
         options: Optional[Dict[str, Any]] = None,
         timeout_info: TimeoutInfoWideType = None,
     ) -> Optional[API_RESPONSE]:
-        full_path = f"{self.base_path}/{path}" if path else self.base_path
+        full_path = self._base_path_slash + path if path else self.base_path
         response = await self._request(
             method=http_methods.GET,
             path=full_path,
             url_params=options,
             timeout_info=timeout_info,
+            use_cache=True,
         )
         if isinstance(response, dict):
             return response
@@ -1619,7 +2185,7 @@ class AsyncAstraDBCollection:
         document: Optional[API_RESPONSE] = None,
         timeout_info: TimeoutInfoWideType = None,
     ) -> API_RESPONSE:
-        full_path = f"{self.base_path}/{path}" if path else self.base_path
+        full_path = self._base_path_slash + path if path else self.base_path
         response = await self._request(
             method=http_methods.PUT,
             path=full_path,
@@ -1633,13 +2199,17 @@ class AsyncAstraDBCollection:
         path: Optional[str] = None,
         document: Optional[API_DOC] = None,
         timeout_info: TimeoutInfoWideType = None,
+        skip_error_check: bool = False,
+        use_cache: bool = False,
     ) -> API_RESPONSE:
-        full_path = f"{self.base_path}/{path}" if path else self.base_path
+        full_path = self._base_path_slash + path if path else self.base_path
         response = await self._request(
             method=http_methods.POST,
             path=full_path,
             json_data=document,
+            skip_error_check=skip_error_check,
             timeout_info=timeout_info,
+            use_cache=use_cache,
         )
         return response
 
@@ -1888,6 +2458,209 @@ class AsyncAstraDBCollection:
             raw_response_callback=raw_response_callback,
         )
 
+    async def find_pipelined(
+        self,
+        filters: List[Dict[str, Any]],
+        projection: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, Any]] = None,
+        options: Optional[Dict[str, Any]] = None,
+        concurrency: int = DEFAULT_FIND_PIPELINED_CONCURRENCY,
+        timeout_info: TimeoutInfoWideType = None,
+    ) -> List[API_RESPONSE]:
+        """
+        Run several independent `find` queries, one per filter, concurrently.
+
+        Args:
+            filters (list): A list of filters, each resulting in a `find` call.
+            projection (dict, optional): Specifies the fields to return.
+            sort (dict, optional): Specifies the order in which to return matching documents.
+            options (dict, optional): Additional options for the queries.
+            concurrency (int, optional): The maximum number of queries in flight
+                at any given time.
+            timeout_info: a float, or a TimeoutInfo dict, for each single HTTP request.
+                Note that a 'read' timeout event will not block the action taken
+                by the API server if it has received the request already.
+
+        Returns:
+            list: The query responses, in the same order as the input filters.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def concurrent_find(filter: Dict[str, Any]) -> API_RESPONSE:
+            async with sem:
+                return await self.find(
+                    filter=filter,
+                    projection=projection,
+                    sort=sort,
+                    options=options,
+                    timeout_info=timeout_info,
+                )
+
+        return list(await asyncio.gather(*(concurrent_find(f) for f in filters)))
+
+    async def find_stream(
+        self,
+        filter: Optional[Dict[str, Any]] = None,
+        projection: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, Any]] = None,
+        options: Optional[Dict[str, Any]] = None,
+        timeout_info: TimeoutInfoWideType = None,
+    ) -> AsyncIterator[API_DOC]:
+        """
+        Find documents in the collection, yielding each of them as soon as
+        it is received, rather than waiting for (and holding in memory)
+        the whole response. This is most useful with large result pages.
+        Incremental parsing requires the optional `ijson` package: without it,
+        documents are yielded only once the full response has been read.
+        No pagination is performed: only the first page of results is returned.
+
+        Args:
+            filter (dict, optional): Criteria to filter documents.
+            projection (dict, optional): Specifies the fields to return.
+            sort (dict, optional): Specifies the order in which to return matching documents.
+            options (dict, optional): Additional options for the query.
+            timeout_info: a float, or a TimeoutInfo dict, for the HTTP request.
+                Note that a 'read' timeout event will not block the action taken
+                by the API server if it has received the request already.
+
+        Returns:
+            AsyncIterator: the documents matching the query, one at a time.
+        """
+        json_query = make_payload(
+            top_level="find",
+            filter=filter,
+            projection=projection,
+            options=options,
+            sort=sort,
+        )
+
+        async for document in async_api_request_documents(
+            client=self.client,
+            base_url=self.astra_db.base_url,
+            auth_header=DEFAULT_AUTH_HEADER,
+            token=self.astra_db.token,
+            method=http_methods.POST,
+            json_data=normalize_for_api(json_query),
+            url_params=None,
+            path=self.base_path,
+            caller_name=self.caller_name,
+            caller_version=self.caller_version,
+            timeout=to_httpx_timeout(timeout_info),
+            additional_headers=self.additional_headers,
+            compress=self.astra_db.compress,
+        ):
+            yield restore_from_api(document)
+
+    async def find_typed(
+        self,
+        filter: Optional[Dict[str, Any]] = None,
+        projection: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, Any]] = None,
+        options: Optional[Dict[str, Any]] = None,
+        timeout_info: TimeoutInfoWideType = None,
+    ) -> FindResponse:
+        """
+        Find documents in the collection, returning a typed response.
+        The response body is decoded directly into a `FindResponse` struct,
+        with attribute access to its parts, instead of a dictionary.
+        Requires the optional `msgspec` package.
+
+        Args:
+            filter (dict, optional): Criteria to filter documents.
+            projection (dict, optional): Specifies the fields to return.
+            sort (dict, optional): Specifies the order in which to return matching documents.
+            options (dict, optional): Additional options for the query.
+            timeout_info: a float, or a TimeoutInfo dict, for the HTTP request.
+                Note that a 'read' timeout event will not block the action taken
+                by the API server if it has received the request already.
+
+        Returns:
+            FindResponse: the response, in typed form.
+        """
+        from astrapy.core.typed_responses import FindResponse, decode_typed_response
+
+        json_query = make_payload(
+            top_level="find",
+            filter=filter,
+            projection=projection,
+            options=options,
+            sort=sort,
+        )
+        normalized_query = normalize_for_api(json_query)
+
+        raw_response = await async_raw_api_request(
+            client=self.client,
+            base_url=self.astra_db.base_url,
+            auth_header=DEFAULT_AUTH_HEADER,
+            token=self.astra_db.token,
+            method=http_methods.POST,
+            json_data=normalized_query,
+            url_params=None,
+            path=self.base_path,
+            caller_name=self.caller_name,
+            caller_version=self.caller_version,
+            timeout=to_httpx_timeout(timeout_info),
+            additional_headers=self.additional_headers,
+            compress=self.astra_db.compress,
+        )
+        raw_response.raise_for_status()
+        return decode_typed_response(raw_response, FindResponse, normalized_query)
+
+    async def find_one_typed(
+        self,
+        filter: Optional[Dict[str, Any]] = None,
+        projection: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, Any]] = None,
+        options: Optional[Dict[str, Any]] = None,
+        timeout_info: TimeoutInfoWideType = None,
+    ) -> FindOneResponse:
+        """
+        Find a single document in the collection, returning a typed response.
+        The response body is decoded directly into a `FindOneResponse` struct,
+        with attribute access to its parts, instead of a dictionary.
+        Requires the optional `msgspec` package.
+
+        Args:
+            filter (dict, optional): Criteria to filter documents.
+            projection (dict, optional): Specifies the fields to return.
+            sort (dict, optional): Specifies the order in which to return the document.
+            options (dict, optional): Additional options for the query.
+            timeout_info: a float, or a TimeoutInfo dict, for the HTTP request.
+                Note that a 'read' timeout event will not block the action taken
+                by the API server if it has received the request already.
+
+        Returns:
+            FindOneResponse: the response, in typed form.
+        """
+        from astrapy.core.typed_responses import FindOneResponse, decode_typed_response
+
+        json_query = make_payload(
+            top_level="findOne",
+            filter=filter,
+            projection=projection,
+            options=options,
+            sort=sort,
+        )
+        normalized_query = normalize_for_api(json_query)
+
+        raw_response = await async_raw_api_request(
+            client=self.client,
+            base_url=self.astra_db.base_url,
+            auth_header=DEFAULT_AUTH_HEADER,
+            token=self.astra_db.token,
+            method=http_methods.POST,
+            json_data=normalized_query,
+            url_params=None,
+            path=self.base_path,
+            caller_name=self.caller_name,
+            caller_version=self.caller_version,
+            timeout=to_httpx_timeout(timeout_info),
+            additional_headers=self.additional_headers,
+            compress=self.astra_db.compress,
+        )
+        raw_response.raise_for_status()
+        return decode_typed_response(raw_response, FindOneResponse, normalized_query)
+
     async def pop(
         self,
         filter: Dict[str, Any],
@@ -1916,10 +2689,8 @@ class AsyncAstraDBCollection:
             options=options,
         )
 
-        response = await self._request(
-            method=http_methods.POST,
-            path=self.base_path,
-            json_data=json_query,
+        response = await self._post(
+            document=json_query,
             timeout_info=timeout_info,
         )
 
@@ -1953,10 +2724,8 @@ class AsyncAstraDBCollection:
             options=options,
         )
 
-        response = await self._request(
-            method=http_methods.POST,
-            path=self.base_path,
-            json_data=json_query,
+        response = await self._post(
+            document=json_query,
             timeout_info=timeout_info,
         )
 
@@ -1996,10 +2765,8 @@ class AsyncAstraDBCollection:
             sort=sort,
         )
 
-        response = await self._request(
-            method=http_methods.POST,
-            path=f"{self.base_path}",
-            json_data=json_query,
+        response = await self._post(
+            document=json_query,
             timeout_info=timeout_info,
         )
 
@@ -2079,10 +2846,8 @@ class AsyncAstraDBCollection:
             projection=projection,
         )
 
-        response = await self._request(
-            method=http_methods.POST,
-            path=f"{self.base_path}",
-            json_data=json_query,
+        response = await self._post(
+            document=json_query,
             timeout_info=timeout_info,
         )
 
@@ -2158,10 +2923,8 @@ class AsyncAstraDBCollection:
             projection=projection,
         )
 
-        response = await self._request(
-            method=http_methods.POST,
-            path=f"{self.base_path}",
-            json_data=json_query,
+        response = await self._post(
+            document=json_query,
             timeout_info=timeout_info,
         )
 
@@ -2196,10 +2959,10 @@ class AsyncAstraDBCollection:
 
     async def find_one(
         self,
-        filter: Optional[Dict[str, Any]] = {},
-        projection: Optional[Dict[str, Any]] = {},
-        sort: Optional[Dict[str, Any]] = {},
-        options: Optional[Dict[str, Any]] = {},
+        filter: Optional[Dict[str, Any]] = None,
+        projection: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, Any]] = None,
+        options: Optional[Dict[str, Any]] = None,
         timeout_info: TimeoutInfoWideType = None,
     ) -> API_RESPONSE:
         """
@@ -2229,7 +2992,11 @@ class AsyncAstraDBCollection:
             sort=sort,
         )
 
-        response = await self._post(document=json_query, timeout_info=timeout_info)
+        response = await self._post(
+            document=json_query,
+            timeout_info=timeout_info,
+            use_cache=True,
+        )
 
         return response
 
@@ -2279,6 +3046,7 @@ class AsyncAstraDBCollection:
         document: API_DOC,
         failures_allowed: bool = False,
         timeout_info: TimeoutInfoWideType = None,
+        vector: Optional[Iterable[float]] = None,
     ) -> API_RESPONSE:
         """
         Insert a single document into the collection.
@@ -2289,16 +3057,20 @@ class AsyncAstraDBCollection:
             timeout_info: a float, or a TimeoutInfo dict, for the HTTP request.
                 Note that a 'read' timeout event will not block the action taken
                 by the API server if it has received the request already.
+            vector (Iterable[float], optional): a vector to store as the "$vector"
+                of the document (the passed document is not modified).
+                One-dimensional numpy float arrays are written without conversion
+                to a list of floats if `orjson` is installed.
 
         Returns:
             dict: The response from the database after the insert operation.
         """
-        json_query = make_payload(top_level="insertOne", document=document)
+        if vector is not None:
+            document = {**document, "$vector": vector}
+        json_query = {"insertOne": {"document": document}}
 
-        response = await self._request(
-            method=http_methods.POST,
-            path=self.base_path,
-            json_data=json_query,
+        response = await self._post(
+            document=json_query,
             skip_error_check=failures_allowed,
             timeout_info=timeout_info,
         )
@@ -2314,6 +3086,10 @@ class AsyncAstraDBCollection:
     ) -> API_RESPONSE:
         """
         Insert multiple documents into the collection.
+        Lists longer than what the API accepts in a single request are
+        transparently split into chunks, inserted concurrently (sequentially
+        if the insertion is ordered, stopping at the first chunk with errors),
+        and the responses merged into one.
 
         Args:
             documents (list): A list of documents to insert.
@@ -2323,18 +3099,53 @@ class AsyncAstraDBCollection:
             timeout_info: a float, or a TimeoutInfo dict, for the HTTP request.
                 Note that a 'read' timeout event will not block the action taken
                 by the API server if it has received the request already.
+                For lists that get chunked, this applies to each request.
 
         Returns:
             dict: The response from the database after the insert operation.
         """
+        if len(documents) > MAX_INSERT_NUM_DOCUMENTS:
+            sem = asyncio.Semaphore(DEFAULT_INSERT_MANY_CONCURRENCY)
+
+            async def _insert_chunk(
+                chunk: List[API_DOC],
+            ) -> Union[API_RESPONSE, APIRequestError]:
+                async with sem:
+                    try:
+                        return await self.insert_many(
+                            chunk,
+                            options,
+                            partial_failures_allowed,
+                            timeout_info=timeout_info,
+                        )
+                    except APIRequestError as e:
+                        return e
+
+            chunks = [
+                documents[i : i + DEFAULT_INSERT_NUM_DOCUMENTS]
+                for i in range(0, len(documents), DEFAULT_INSERT_NUM_DOCUMENTS)
+            ]
+            chunk_responses: List[Union[API_RESPONSE, APIRequestError]] = []
+            if (options or {}).get("ordered"):
+                # one chunk at a time, stopping at the first one with errors
+                for chunk in chunks:
+                    chunk_responses.append(await _insert_chunk(chunk))
+                    if _is_failed_insert_many_response(chunk_responses[-1]):
+                        break
+            else:
+                chunk_responses = list(
+                    await asyncio.gather(*[_insert_chunk(chunk) for chunk in chunks])
+                )
+            return _merge_insert_many_responses(
+                chunk_responses, partial_failures_allowed
+            )
+
         json_query = make_payload(
             top_level="insertMany", documents=documents, options=options
         )
 
-        response = await self._request(
-            method=http_methods.POST,
-            path=f"{self.base_path}",
-            json_data=json_query,
+        response = await self._post(
+            document=json_query,
             skip_error_check=partial_failures_allowed,
             timeout_info=timeout_info,
         )
@@ -2382,7 +3193,7 @@ class AsyncAstraDBCollection:
             partial_failures_allowed: bool,
         ) -> Union[API_RESPONSE, Exception]:
             async with sem:
-                logger.debug(f"Processing chunk #{index + 1} of size {len(docs)}")
+                logger.debug("Processing chunk #%i of size %i", index + 1, len(docs))
                 try:
                     im_result = await self.insert_many(
                         documents=docs,
@@ -2391,12 +3202,16 @@ class AsyncAstraDBCollection:
                         timeout_info=timeout_info,
                     )
                     logger.debug(
-                        f"Finished processing chunk #{index + 1} of size {len(docs)}"
+                        "Finished processing chunk #%i of size %i",
+                        index + 1,
+                        len(docs),
                     )
                     return im_result
                 except APIRequestError as e:
                     logger.debug(
-                        f"Got APIRequestError while processing chunk #{index + 1} of size {len(docs)}"
+                        "Got APIRequestError while processing chunk #%i of size %i",
+                        index + 1,
+                        len(docs),
                     )
                     if partial_failures_allowed:
                         return e
@@ -2455,10 +3270,8 @@ class AsyncAstraDBCollection:
             sort=sort,
         )
 
-        response = await self._request(
-            method=http_methods.POST,
-            path=f"{self.base_path}",
-            json_data=json_query,
+        response = await self._post(
+            document=json_query,
             timeout_info=timeout_info,
         )
 
@@ -2491,10 +3304,8 @@ class AsyncAstraDBCollection:
             options=options,
         )
 
-        response = await self._request(
-            method=http_methods.POST,
-            path=f"{self.base_path}",
-            json_data=json_query,
+        response = await self._post(
+            document=json_query,
             timeout_info=timeout_info,
         )
 
@@ -2536,16 +3347,13 @@ class AsyncAstraDBCollection:
         Returns:
             dict: The response from the database after the delete operation.
         """
-        json_query = make_payload(
-            top_level="deleteOne",
-            filter={"_id": id},
-            sort=sort,
-        )
+        delete_one: Dict[str, Any] = {"filter": {"_id": id}}
+        if sort is not None:
+            delete_one["sort"] = sort
+        json_query = {"deleteOne": delete_one}
 
-        response = await self._request(
-            method=http_methods.POST,
-            path=f"{self.base_path}",
-            json_data=json_query,
+        response = await self._post(
+            document=json_query,
             timeout_info=timeout_info,
         )
 
@@ -2575,10 +3383,8 @@ class AsyncAstraDBCollection:
             sort=sort,
         )
 
-        response = await self._request(
-            method=http_methods.POST,
-            path=f"{self.base_path}",
-            json_data=json_query,
+        response = await self._post(
+            document=json_query,
             timeout_info=timeout_info,
         )
 
@@ -2610,10 +3416,8 @@ class AsyncAstraDBCollection:
             }
         }
 
-        response = await self._request(
-            method=http_methods.POST,
-            path=f"{self.base_path}",
-            json_data=json_query,
+        response = await self._post(
+            document=json_query,
             skip_error_check=skip_error_check,
             timeout_info=timeout_info,
         )
@@ -2692,10 +3496,8 @@ class AsyncAstraDBCollection:
             }
         }
 
-        response = await self._request(
-            method=http_methods.POST,
-            path=f"{self.base_path}",
-            json_data=json_query,
+        response = await self._post(
+            document=json_query,
             timeout_info=timeout_info,
         )
 
@@ -2795,7 +3597,7 @@ class AsyncAstraDBCollection:
 
 class AstraDB:
     # Initialize the shared httpx client as a class attribute
-    client = httpx.Client()
+    client = _make_http_client()
 
     def __init__(
         self,
@@ -2806,6 +3608,8 @@ class AstraDB:
         namespace: Optional[str] = None,
         caller_name: Optional[str] = None,
         caller_version: Optional[str] = None,
+        compress: bool = False,
+        max_pool_size: Optional[int] = None,
     ) -> None:
         """
         Initialize an Astra DB instance.
@@ -2818,16 +3622,32 @@ class AstraDB:
             namespace (str, optional): Namespace for the database.
             caller_name (str, optional): identity of the caller ("my_framework")
             caller_version (str, optional): version of the caller code ("1.0.3")
+            compress (bool, optional): if True, request bodies above a certain
+                size (such as large `insert_many` payloads) are gzip-compressed.
+                Default is False.
+            max_pool_size (int, optional): if provided, this instance (and the
+                collections it spawns) gets a dedicated connection pool holding up
+                to this many connections, instead of the shared default one.
+                A good starting point is the number of requests expected to be
+                in flight at once, e.g. (number of cores * 2) + 1 for a worker
+                pool kept busy with insertions.
         """
         self.caller_name = caller_name
         self.caller_version = caller_version
+        self.compress = compress
+        self.max_pool_size = max_pool_size
+        # a dedicated http client, if requested, is owned (and closed) by this
+        # instance: copies and collections spawned from it share it
+        self._owns_client = max_pool_size is not None
+        if max_pool_size is not None:
+            self.client = _make_http_client(max_pool_size)
 
         if api_endpoint is None:
             raise AssertionError("Must provide api_endpoint")
 
         if namespace is None:
             logger.info(
-                f"ASTRA_DB_KEYSPACE is not set. Defaulting to '{DEFAULT_KEYSPACE_NAME}'"
+                "ASTRA_DB_KEYSPACE is not set. Defaulting to %r", DEFAULT_KEYSPACE_NAME
             )
             namespace = DEFAULT_KEYSPACE_NAME
 
@@ -2857,6 +3677,27 @@ class AstraDB:
             if comp != ""
         ]
         self.base_path: str = f"/{'/'.join(base_path_components)}"
+        self._base_path_slash = self.base_path + "/"
+
+    def __enter__(self) -> AstraDB:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]] = None,
+        exc_value: Optional[BaseException] = None,
+        traceback: Optional[TracebackType] = None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the dedicated http client of this instance, if it owns one (see
+        `max_pool_size`), after which the copies and collections sharing it
+        cannot be used anymore. The default, shared client is left open.
+        """
+        if self._owns_client:
+            self.client.close()
 
     def __repr__(self) -> str:
         return f'AstraDB[endpoint="{self.base_url}", keyspace="{self.namespace}"]'
@@ -2871,6 +3712,8 @@ class AstraDB:
                     self.base_path == other.base_path,
                     self.caller_name == other.caller_name,
                     self.caller_version == other.caller_version,
+                    self.compress == other.compress,
+                    self.max_pool_size == other.max_pool_size,
                 ]
             )
         else:
@@ -2886,8 +3729,10 @@ class AstraDB:
         namespace: Optional[str] = None,
         caller_name: Optional[str] = None,
         caller_version: Optional[str] = None,
+        compress: Optional[bool] = None,
+        max_pool_size: Optional[int] = None,
     ) -> AstraDB:
-        return AstraDB(
+        astra_db = AstraDB(
             token=token or self.token,
             api_endpoint=api_endpoint or self.base_url,
             api_path=api_path or self.api_path,
@@ -2895,7 +3740,14 @@ class AstraDB:
             namespace=namespace or self.namespace,
             caller_name=caller_name or self.caller_name,
             caller_version=caller_version or self.caller_version,
+            compress=compress if compress is not None else self.compress,
+            max_pool_size=max_pool_size,
         )
+        if max_pool_size is None:
+            # same pool sizing: keep using the same http client (and connections)
+            astra_db.max_pool_size = self.max_pool_size
+            astra_db.client = self.client
+        return astra_db
 
     def to_async(self) -> AsyncAstraDB:
         return AsyncAstraDB(
@@ -2906,6 +3758,8 @@ class AstraDB:
             namespace=self.namespace,
             caller_name=self.caller_name,
             caller_version=self.caller_version,
+            compress=self.compress,
+            max_pool_size=self.max_pool_size,
         )
 
     def set_caller(
@@ -2939,31 +3793,53 @@ class AstraDB:
             caller_version=self.caller_version,
             timeout=to_httpx_timeout(timeout_info),
             additional_headers={},
+            compress=self.compress,
         )
         response = restore_from_api(direct_response)
         return response
 
+    def _post(
+        self,
+        path: Optional[str] = None,
+        document: Optional[API_DOC] = None,
+        timeout_info: TimeoutInfoWideType = None,
+        skip_error_check: bool = False,
+    ) -> API_RESPONSE:
+        full_path = self._base_path_slash + path if path else self.base_path
+        response = self._request(
+            method=http_methods.POST,
+            path=full_path,
+            json_data=document,
+            skip_error_check=skip_error_check,
+            timeout_info=timeout_info,
+        )
+        return response
+
     def post_raw_request(
         self, body: Dict[str, Any], timeout_info: TimeoutInfoWideType = None
     ) -> API_RESPONSE:
-        return self._request(
-            method=http_methods.POST,
-            path=self.base_path,
-            json_data=body,
+        return self._post(
+            document=body,
             timeout_info=timeout_info,
         )
 
-    def collection(self, collection_name: str) -> AstraDBCollection:
+    def collection(
+        self, collection_name: str, cache_ttl: Optional[float] = None
+    ) -> AstraDBCollection:
         """
         Retrieve a collection from the database.
 
         Args:
             collection_name (str): The name of the collection to retrieve.
+            cache_ttl (float, optional): if provided, the collection caches
+                read responses for this many seconds (see AstraDBCollection).
 
         Returns:
             AstraDBCollection: The collection object.
         """
-        return AstraDBCollection(collection_name=collection_name, astra_db=self)
+        return AstraDBCollection(
+            collection_name=collection_name, astra_db=self, cache_ttl=cache_ttl
+        )
 
     def get_collections(
         self,
@@ -2992,10 +3868,8 @@ class AstraDB:
             options=options,
         )
 
-        response = self._request(
-            method=http_methods.POST,
-            path=self.base_path,
-            json_data=json_query,
+        response = self._post(
+            document=json_query,
             timeout_info=timeout_info,
         )
 
@@ -3066,10 +3940,8 @@ class AstraDB:
         }
 
         # Make the request to the endpoint
-        self._request(
-            method=http_methods.POST,
-            path=f"{self.base_path}",
-            json_data={"createCollection": jsondata},
+        self._post(
+            document={"createCollection": jsondata},
             timeout_info=timeout_info,
         )
 
@@ -3095,10 +3967,8 @@ class AstraDB:
         if not collection_name:
             raise ValueError("Must provide a collection name")
 
-        response = self._request(
-            method=http_methods.POST,
-            path=f"{self.base_path}",
-            json_data={"deleteCollection": {"name": collection_name}},
+        response = self._post(
+            document={"deleteCollection": {"name": collection_name}},
             timeout_info=timeout_info,
         )
 
@@ -3115,6 +3985,8 @@ class AsyncAstraDB:
         namespace: Optional[str] = None,
         caller_name: Optional[str] = None,
         caller_version: Optional[str] = None,
+        compress: bool = False,
+        max_pool_size: Optional[int] = None,
     ) -> None:
         """
         Initialize an Astra DB instance.
@@ -3127,17 +3999,32 @@ class AsyncAstraDB:
             namespace (str, optional): Namespace for the database.
             caller_name (str, optional): identity of the caller ("my_framework")
             caller_version (str, optional): version of the caller code ("1.0.3")
+            compress (bool, optional): if True, request bodies above a certain
+                size (such as large `insert_many` payloads) are gzip-compressed.
+                Default is False.
+            max_pool_size (int, optional): if provided, this instance (and the
+                collections it spawns) gets a dedicated connection pool holding up
+                to this many connections, instead of the shared default one.
+                A good starting point is the number of requests expected to be
+                in flight at once, e.g. (number of cores * 2) + 1 for a worker
+                pool kept busy with insertions.
         """
         self.caller_name = caller_name
         self.caller_version = caller_version
+        self.compress = compress
+        self.max_pool_size = max_pool_size
+
+        # the http client is created lazily at first use (again if closed) by
+        # the instance owning it: collections spawned from this one share it
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_owner: AsyncAstraDB = self
 
-        self.client = httpx.AsyncClient()
         if api_endpoint is None:
             raise AssertionError("Must provide api_endpoint")
 
         if namespace is None:
             logger.info(
-                f"ASTRA_DB_KEYSPACE is not set. Defaulting to '{DEFAULT_KEYSPACE_NAME}'"
+                "ASTRA_DB_KEYSPACE is not set. Defaulting to %r", DEFAULT_KEYSPACE_NAME
             )
             namespace = DEFAULT_KEYSPACE_NAME
 
@@ -3167,6 +4054,7 @@ class AsyncAstraDB:
             if comp != ""
         ]
         self.base_path: str = f"/{'/'.join(base_path_components)}"
+        self._base_path_slash = self.base_path + "/"
 
     def __repr__(self) -> str:
         return f'AsyncAstraDB[endpoint="{self.base_url}", keyspace="{self.namespace}"]'
@@ -3181,11 +4069,23 @@ class AsyncAstraDB:
                     self.base_path == other.base_path,
                     self.caller_name == other.caller_name,
                     self.caller_version == other.caller_version,
+                    self.compress == other.compress,
+                    self.max_pool_size == other.max_pool_size,
                 ]
             )
         else:
             return False
 
+    @property
+    def client(self) -> httpx.AsyncClient:
+        owner = self._client_owner
+        if owner._client is None or owner._client.is_closed:
+            owner._client = httpx.AsyncClient(
+                http2=True,
+                limits=_make_http_limits(owner.max_pool_size),
+            )
+        return owner._client
+
     async def __aenter__(self) -> AsyncAstraDB:
         return self
 
@@ -3195,7 +4095,15 @@ class AsyncAstraDB:
         exc_value: Optional[BaseException] = None,
         traceback: Optional[TracebackType] = None,
     ) -> None:
-        await self.client.aclose()
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the http client of this instance, if it owns it: instances sharing
+        it are unaffected (they would get a new one if used afterwards).
+        """
+        if self._client is not None:
+            await self._client.aclose()
 
     def copy(
         self,
@@ -3207,8 +4115,10 @@ class AsyncAstraDB:
         namespace: Optional[str] = None,
         caller_name: Optional[str] = None,
         caller_version: Optional[str] = None,
+        compress: Optional[bool] = None,
+        max_pool_size: Optional[int] = None,
     ) -> AsyncAstraDB:
-        return AsyncAstraDB(
+        astra_db = AsyncAstraDB(
             token=token or self.token,
             api_endpoint=api_endpoint or self.base_url,
             api_path=api_path or self.api_path,
@@ -3216,7 +4126,13 @@ class AsyncAstraDB:
             namespace=namespace or self.namespace,
             caller_name=caller_name or self.caller_name,
             caller_version=caller_version or self.caller_version,
+            compress=compress if compress is not None else self.compress,
+            max_pool_size=max_pool_size or self.max_pool_size,
         )
+        if max_pool_size is None:
+            # same pool sizing: keep using the same http client (and connections)
+            astra_db._client_owner = self._client_owner
+        return astra_db
 
     def to_sync(self) -> AstraDB:
         return AstraDB(
@@ -3227,6 +4143,8 @@ class AsyncAstraDB:
             namespace=self.namespace,
             caller_name=self.caller_name,
             caller_version=self.caller_version,
+            compress=self.compress,
+            max_pool_size=self.max_pool_size,
         )
 
     def set_caller(
@@ -3260,26 +4178,46 @@ class AsyncAstraDB:
             caller_version=self.caller_version,
             timeout=to_httpx_timeout(timeout_info),
             additional_headers={},
+            compress=self.compress,
         )
         response = restore_from_api(adirect_response)
         return response
 
+    async def _post(
+        self,
+        path: Optional[str] = None,
+        document: Optional[API_DOC] = None,
+        timeout_info: TimeoutInfoWideType = None,
+        skip_error_check: bool = False,
+    ) -> API_RESPONSE:
+        full_path = self._base_path_slash + path if path else self.base_path
+        response = await self._request(
+            method=http_methods.POST,
+            path=full_path,
+            json_data=document,
+            skip_error_check=skip_error_check,
+            timeout_info=timeout_info,
+        )
+        return response
+
     async def post_raw_request(
         self, body: Dict[str, Any], timeout_info: TimeoutInfoWideType = None
     ) -> API_RESPONSE:
-        return await self._request(
-            method=http_methods.POST,
-            path=self.base_path,
-            json_data=body,
+        return await self._post(
+            document=body,
             timeout_info=timeout_info,
         )
 
-    async def collection(self, collection_name: str) -> AsyncAstraDBCollection:
+    async def collection(
+        self, collection_name: str, cache_ttl: Optional[float] = None
+    ) -> AsyncAstraDBCollection:
         """
         Retrieve a collection from the database.
 
         Args:
             collection_name (str): The name of the collection to retrieve.
+            cache_ttl (float, optional): if provided, the collection caches
+                read responses for this many seconds (see AsyncAstraDBCollection).
             timeout_info: a float, or a TimeoutInfo dict, for the HTTP request.
                 Note that a 'read' timeout event will not block the action taken
                 by the API server if it has received the request already.
@@ -3287,7 +4225,9 @@ class AsyncAstraDB:
         Returns:
             AstraDBCollection: The collection object.
         """
-        return AsyncAstraDBCollection(collection_name=collection_name, astra_db=self)
+        return AsyncAstraDBCollection(
+            collection_name=collection_name, astra_db=self, cache_ttl=cache_ttl
+        )
 
     async def get_collections(
         self,
@@ -3316,10 +4256,8 @@ class AsyncAstraDB:
             options=options,
         )
 
-        response = await self._request(
-            method=http_methods.POST,
-            path=self.base_path,
-            json_data=json_query,
+        response = await self._post(
+            document=json_query,
             timeout_info=timeout_info,
         )
 
@@ -3390,10 +4328,8 @@ class AsyncAstraDB:
         }
 
         # Make the request to the endpoint
-        await self._request(
-            method=http_methods.POST,
-            path=f"{self.base_path}",
-            json_data={"createCollection": jsondata},
+        await self._post(
+            document={"createCollection": jsondata},
             timeout_info=timeout_info,
         )
 
@@ -3419,10 +4355,8 @@ class AsyncAstraDB:
         if not collection_name:
             raise ValueError("Must provide a collection name")
 
-        response = await self._request(
-            method=http_methods.POST,
-            path=f"{self.base_path}",
-            json_data={"deleteCollection": {"name": collection_name}},
+        response = await self._post(
+            document={"deleteCollection": {"name": collection_name}},
             timeout_info=timeout_info,
         )
 
@@ -28,8 +28,23 @@ DEFAULT_AUTH_HEADER = "Token"
 DEFAULT_KEYSPACE_NAME = "default_keyspace"
 DEFAULT_REGION = "us-east1"
 
+# Connection pooling and retries (on connection failures only) for the HTTP clients
+DEFAULT_HTTP_MAX_CONNECTIONS = 100
+DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_HTTP_CONNECT_RETRIES = 3
+
+DEFAULT_RESPONSE_CACHE_MAX_SIZE = 1024
+DEFAULT_REQUEST_HEADERS_CACHE_SIZE = 64
+
+# Opt-in gzip compression of request bodies: only worth it above a certain size
+DEFAULT_REQUEST_COMPRESSION_MIN_BYTES = 1024
+DEFAULT_REQUEST_COMPRESSION_LEVEL = 1
+
 MAX_INSERT_NUM_DOCUMENTS = 100
 DEFAULT_INSERT_NUM_DOCUMENTS = 50
+DEFAULT_INSERT_MANY_CONCURRENCY = 8
+DEFAULT_FIND_PIPELINED_CONCURRENCY = 8
+DEFAULT_STREAM_CHUNK_SIZE = 65536
 
 # Some of these are repeated by hand from idiomatic, tolerable duplication
 # as long as `core` is in place:
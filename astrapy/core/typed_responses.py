@@ -0,0 +1,91 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Typed counterparts of the dict responses for well-known commands.
+
+Responses are decoded straight into these structs by `msgspec`, skipping
+the construction of intermediate dictionaries for the response envelope.
+This module requires the optional `msgspec` package, and is only imported
+by the methods returning typed responses.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Type, TypeVar
+
+import httpx
+import msgspec
+
+from astrapy.core.api import APIRequestError
+from astrapy.core.core_types import API_DOC
+from astrapy.core.utils import restore_from_api
+
+
+class FindData(msgspec.Struct):
+    documents: List[API_DOC]
+    nextPageState: Optional[str] = None
+
+
+class FindResponse(msgspec.Struct):
+    data: FindData
+    status: Optional[Dict[str, Any]] = None
+    errors: Optional[List[Dict[str, Any]]] = None
+
+
+class FindOneData(msgspec.Struct):
+    document: Optional[API_DOC] = None
+
+
+class FindOneResponse(msgspec.Struct):
+    data: FindOneData
+    status: Optional[Dict[str, Any]] = None
+    errors: Optional[List[Dict[str, Any]]] = None
+
+
+TypedResponse = TypeVar("TypedResponse", FindResponse, FindOneResponse)
+
+
+def decode_typed_response(
+    raw_response: httpx.Response,
+    response_type: Type[TypedResponse],
+    json_data: Optional[Dict[str, Any]],
+) -> TypedResponse:
+    """
+    Decode the body of a response into the given struct type, restoring
+    the documents found therein (e.g. `{"$date": ...}` to datetimes).
+    A body not matching the expected shape (e.g. an error response),
+    or containing errors from the API, results in an APIRequestError.
+
+    Args:
+        raw_response (httpx.Response): the (successful) HTTP response.
+        response_type: the struct class to decode the body into.
+        json_data (dict, optional): the request payload, for error reporting.
+
+    Returns:
+        the response as an instance of `response_type`.
+    """
+    try:
+        response = msgspec.json.decode(raw_response.content, type=response_type)
+    except msgspec.DecodeError:
+        raise APIRequestError(raw_response, payload=json_data)
+    if response.errors:
+        raise APIRequestError(raw_response, payload=json_data)
+    if isinstance(response, FindResponse):
+        response.data.documents = [
+            restore_from_api(document) for document in response.data.documents
+        ]
+    elif response.data.document is not None:
+        response.data.document = restore_from_api(response.data.document)
+    return response
@@ -14,19 +14,68 @@
 
 from __future__ import annotations
 
+import copy
 import datetime
+import gzip
 import json
 import logging
+import math
+import re
+import threading
 import time
-from typing import Any, Dict, Iterable, List, Optional, TypedDict, Union, cast
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypedDict,
+    Union,
+    cast,
+)
 
 import httpx
 
 from astrapy import __version__
 from astrapy.core.core_types import API_RESPONSE
-from astrapy.core.defaults import DEFAULT_REDACTED_HEADERS, DEFAULT_TIMEOUT
+from astrapy.core.defaults import (
+    DEFAULT_REDACTED_HEADERS,
+    DEFAULT_REQUEST_COMPRESSION_LEVEL,
+    DEFAULT_REQUEST_COMPRESSION_MIN_BYTES,
+    DEFAULT_REQUEST_HEADERS_CACHE_SIZE,
+    DEFAULT_RESPONSE_CACHE_MAX_SIZE,
+    DEFAULT_TIMEOUT,
+)
 from astrapy.core.ids import UUID, ObjectId
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+    # datetimes and dataclasses are passed to the `default` (which rejects them)
+    # so that orjson does not accept payloads the standard library would not
+    ORJSON_PAYLOAD_OPTIONS = (
+        orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 
 class CustomLogger(logging.Logger):
     def trace(self, msg: str, *args: Any, **kwargs: Any) -> None:
@@ -78,7 +127,7 @@ def log_request(
     method: str,
     url: str,
     params: Optional[Dict[str, Any]],
-    headers: Dict[str, str],
+    headers: Mapping[str, str],
     json_data: Optional[Dict[str, Any]],
 ) -> None:
     """
@@ -87,9 +136,11 @@ def log_request(
     Args:
         json_data (dict or None): The JSON payload sent with the request, if any.
     """
-    logger.debug(f"Request url: {url}")
-    logger.debug(f"Request method: {method}")
-    logger.debug(f"Request params: {params}")
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    logger.debug("Request url: %s", url)
+    logger.debug("Request method: %s", method)
+    logger.debug("Request params: %s", params)
 
     # Redact known secrets from the request headers
     headers_log = {
@@ -97,10 +148,10 @@ def log_request(
         for hdr_k, hdr_v in headers.items()
     }
 
-    logger.debug(f"Request headers: {headers_log}")
+    logger.debug("Request headers: %s", headers_log)
 
     if json_data:
-        logger.trace(f"Request payload: {json_data}")  # type: ignore
+        logger.trace("Request payload: %s", json_data)  # type: ignore
 
 
 def log_response(r: httpx.Response) -> None:
@@ -110,9 +161,11 @@ def log_response(r: httpx.Response) -> None:
     Args:
         r (requests.Response): The response object from the HTTP request.
     """
-    logger.debug(f"Response status code: {r.status_code}")
-    logger.debug(f"Response headers: {r.headers}")
-    logger.debug(f"Response content: {r.text}")
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    logger.debug("Response status code: %s", r.status_code)
+    logger.debug("Response headers: %s", r.headers)
+    logger.debug("Response content: %s", r.text)
 
 
 def user_agent_string(
@@ -143,6 +196,55 @@ def compose_user_agent(
     return " ".join(all_user_agents)
 
 
+@lru_cache(maxsize=DEFAULT_REQUEST_HEADERS_CACHE_SIZE)
+def compose_common_request_headers(
+    caller_name: Optional[str],
+    caller_version: Optional[str],
+) -> Mapping[str, str]:
+    """
+    Build the token-independent headers common to all requests by a caller.
+    These are computed once for each caller and shared (hence the read-only
+    mapping). Tokens are kept out of this cache on purpose.
+
+    Args:
+        caller_name (str, optional): identity of the caller ("my_framework")
+        caller_version (str, optional): version of the caller code ("1.0.3")
+
+    Returns:
+        Mapping[str, str]: a read-only mapping of the headers.
+    """
+    return MappingProxyType(
+        {
+            "User-Agent": compose_user_agent(caller_name, caller_version),
+            "Content-Type": "application/json",
+        }
+    )
+
+
+def compose_request_headers(
+    auth_header: str,
+    token: Optional[str],
+    caller_name: Optional[str],
+    caller_version: Optional[str],
+) -> Dict[str, str]:
+    """
+    Build the headers for a request with given token and caller.
+
+    Args:
+        auth_header (str): The authentication header key.
+        token (str): The token used for authentication.
+        caller_name (str, optional): identity of the caller ("my_framework")
+        caller_version (str, optional): version of the caller code ("1.0.3")
+
+    Returns:
+        Dict[str, str]: a new dictionary of the headers, free to be extended.
+    """
+    common_headers = compose_common_request_headers(caller_name, caller_version)
+    if token is None:
+        return dict(common_headers)
+    return {auth_header: token, **common_headers}
+
+
 class TimeoutInfo(TypedDict, total=False):
     read: float
     write: float
@@ -166,6 +268,283 @@ def to_httpx_timeout(timeout_info: TimeoutInfoWideType) -> Union[httpx.Timeout,
         raise ValueError("Invalid timeout info provided.")
 
 
+def _json_default(value: Any) -> Any:
+    # lets the standard library `json` write e.g. numpy arrays
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_json_payload(json_data: Optional[Dict[str, Any]]) -> bytes:
+    """
+    Serialize a (normalized) payload into the compact JSON bytes for a request body.
+
+    If `orjson` is installed it is used (as it outputs bytes directly and is
+    considerably faster, and writes numpy arrays straight from their buffer),
+    falling back to the standard library `json` for payloads it cannot handle
+    (e.g. integers beyond 64 bits) or if not available. Objects that are not
+    JSON-serializable (e.g. datetimes, dataclasses) raise a TypeError either way.
+
+    Args:
+        json_data (dict, optional): the payload to serialize.
+
+    Returns:
+        bytes: the UTF-8 encoded JSON representation of the payload.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                json_data, default=_json_default, option=ORJSON_PAYLOAD_OPTIONS
+            )
+        except TypeError:
+            # orjson.JSONEncodeError: let the standard library have a go at it
+            pass
+    return json.dumps(
+        json_data, allow_nan=False, separators=(",", ":"), default=_json_default
+    ).encode()
+
+
+# a run of digits possibly making an integer beyond what orjson parses exactly
+_LONG_DIGIT_RUN_PATTERN = re.compile(rb"\d{19}")
+# a JSON string literal, or an integer literal with such a run of digits
+_STRING_OR_WIDE_INTEGER_PATTERN = re.compile(
+    rb'"(?:[^"\\]|\\.)*"|(?<![\d.eE+])-?\d{19,}(?![\d.eE])'
+)
+
+
+def _has_wide_integer(content: bytes) -> bool:
+    # the (cheap) search for long runs of digits settles almost all cases:
+    # only if there are some, the body is tokenized to skip those in strings
+    if _LONG_DIGIT_RUN_PATTERN.search(content) is None:
+        return False
+    return any(
+        match.group()[:1] != b'"'
+        for match in _STRING_OR_WIDE_INTEGER_PATTERN.finditer(content)
+    )
+
+
+def decode_json_response(content: bytes) -> Any:
+    """
+    Parse the (UTF-8 encoded) body of a response as JSON.
+
+    Uses `orjson` if installed, the standard library `json` otherwise.
+    As orjson would turn integers beyond 64 bits into (inexact) floats,
+    bodies containing integer literals with enough digits (not within
+    strings) are left to the standard library.
+    In all cases a failure to parse results in a ValueError.
+
+    Args:
+        content (bytes): the raw body of the HTTP response.
+
+    Returns:
+        Any: the parsed JSON content.
+    """
+    if ORJSON_AVAILABLE and not _has_wide_integer(content):
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+class DocumentStreamParser:
+    """
+    An incremental parser for the body of a "find" response, to be fed
+    the raw bytes chunk by chunk as they arrive: each of the documents
+    found under "data.documents" is returned as soon as it is complete,
+    while the (top-level) "errors", if any, are collected.
+
+    If `ijson` is installed, parsing is truly incremental and the full
+    body is never held in memory. Otherwise the chunks are buffered
+    and all documents become available only after `close`.
+    In both cases a failure to parse results in a ValueError.
+    """
+
+    DOCUMENT_PREFIX = "data.documents.item"
+    ERRORS_PREFIX = "errors"
+    BUILD_START_EVENTS = {
+        (DOCUMENT_PREFIX, "start_map"),
+        (ERRORS_PREFIX, "start_array"),
+    }
+
+    def __init__(self) -> None:
+        self.errors: Optional[List[Dict[str, Any]]] = None
+        self._chunks: List[bytes] = []
+        if IJSON_AVAILABLE:
+            self._events = ijson.sendable_list()
+            self._coro = ijson.parse_coro(self._events, use_float=True)
+            self._builder: Optional[Any] = None
+            self._builder_prefix: Optional[str] = None
+
+    def _consume_events(self) -> List[Dict[str, Any]]:
+        documents: List[Dict[str, Any]] = []
+        for prefix, event, value in self._events:
+            if self._builder is None:
+                if (prefix, event) in self.BUILD_START_EVENTS:
+                    self._builder = ijson.ObjectBuilder()
+                    self._builder_prefix = prefix
+                else:
+                    continue
+            self._builder.event(event, value)
+            if prefix == self._builder_prefix and event in {"end_map", "end_array"}:
+                if prefix == self.DOCUMENT_PREFIX:
+                    documents.append(self._builder.value)
+                else:
+                    self.errors = self._builder.value
+                self._builder = None
+                self._builder_prefix = None
+        del self._events[:]
+        return documents
+
+    def feed(self, chunk: bytes) -> List[Dict[str, Any]]:
+        """
+        Process a chunk of the response body.
+
+        Args:
+            chunk (bytes): the next piece of raw response body.
+
+        Returns:
+            list: the documents completed by this chunk, possibly none.
+        """
+        if not IJSON_AVAILABLE:
+            self._chunks.append(chunk)
+            return []
+        try:
+            self._coro.send(chunk)
+        except ijson.JSONError as exc:
+            raise ValueError(str(exc)) from exc
+        return self._consume_events()
+
+    def close(self) -> List[Dict[str, Any]]:
+        """
+        Signal the end of the response body.
+
+        Returns:
+            list: the documents not returned by `feed` yet.
+        """
+        if not IJSON_AVAILABLE:
+            response_body = decode_json_response(b"".join(self._chunks))
+            self._chunks = []
+            if not isinstance(response_body, dict):
+                raise ValueError("Unexpected response body.")
+            self.errors = response_body.get("errors")
+            documents: List[Dict[str, Any]] = (response_body.get("data") or {}).get(
+                "documents", []
+            )
+            return documents
+        try:
+            self._coro.close()
+        except ijson.JSONError as exc:
+            raise ValueError(str(exc)) from exc
+        return self._consume_events()
+
+
+class ResponseCache:
+    """
+    A small in-process LRU cache for API responses, whose entries
+    expire after a fixed time-to-live. Safe to use across threads.
+
+    Responses are copied on the way in and out, so that callers
+    mutating what they get do not alter the cached entries.
+    """
+
+    def __init__(
+        self, ttl: float, max_size: int = DEFAULT_RESPONSE_CACHE_MAX_SIZE
+    ) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: OrderedDict[Hashable, Tuple[float, API_RESPONSE]] = OrderedDict()
+        self._lock = threading.Lock()
+        # incremented by each `clear`, to detect responses outdated in the meantime
+        self.generation = 0
+
+    def get(self, key: Hashable) -> Optional[API_RESPONSE]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, response = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return copy.deepcopy(response)
+
+    def set(
+        self,
+        key: Hashable,
+        response: API_RESPONSE,
+        generation: Optional[int] = None,
+    ) -> None:
+        """
+        Store a response. If the `generation` of the cache at the time the
+        request was issued is given, the response is discarded should the
+        cache have been cleared since (e.g. by a concurrent write).
+        """
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = (
+                time.monotonic() + self.ttl,
+                copy.deepcopy(response),
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.generation += 1
+
+
+def response_cache_key(
+    method: str,
+    path: Optional[str],
+    json_data: Optional[Dict[str, Any]],
+    url_params: Optional[Dict[str, Any]],
+) -> Tuple[str, Optional[str], bytes, bytes]:
+    """
+    Build a stable cache key for a request, regardless of key ordering
+    in the (already normalized) payload and URL parameters.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return (
+                method,
+                path,
+                orjson.dumps(
+                    json_data,
+                    default=_json_default,
+                    option=ORJSON_PAYLOAD_OPTIONS | orjson.OPT_SORT_KEYS,
+                ),
+                orjson.dumps(url_params, option=orjson.OPT_SORT_KEYS),
+            )
+        except TypeError:
+            pass
+    return (
+        method,
+        path,
+        json.dumps(json_data, sort_keys=True, default=_json_default).encode(),
+        json.dumps(url_params, sort_keys=True).encode(),
+    )
+
+
+def compress_request_content(content: bytes, request_headers: Dict[str, str]) -> bytes:
+    """
+    Gzip a request body if it is large enough for compression to pay off,
+    setting the Content-Encoding header accordingly (in-place).
+
+    Args:
+        content (bytes): the encoded request body.
+        request_headers (dict): the headers for the request, possibly updated.
+
+    Returns:
+        bytes: the body to send, compressed or not.
+    """
+    if len(content) <= DEFAULT_REQUEST_COMPRESSION_MIN_BYTES:
+        return content
+    request_headers["Content-Encoding"] = "gzip"
+    return gzip.compress(content, compresslevel=DEFAULT_REQUEST_COMPRESSION_LEVEL)
+
+
 def make_request(
     client: httpx.Client,
     base_url: str,
@@ -179,6 +558,8 @@ def make_request(
     caller_version: Optional[str],
     timeout: Optional[Union[httpx.Timeout, float]],
     additional_headers: Dict[str, str],
+    compress: bool = False,
+    stream: bool = False,
 ) -> httpx.Response:
     """
     Make an HTTP request to a specified URL.
@@ -192,39 +573,39 @@ def make_request(
         path (str, optional): The specific path to append to the base URL.
         json_data (dict, optional): JSON payload to be sent with the request.
         url_params (dict, optional): URL parameters to be sent with the request.
+        compress (bool, optional): whether to gzip-compress large POST bodies.
+        stream (bool, optional): if True, the response body is not read: the
+            caller must then consume it (e.g. with `iter_bytes`) and close it.
 
     Returns:
         requests.Response: The response from the HTTP request.
     """
     # Build the request headers from the token and user agent
-    request_headers = {
-        **{
-            k: v
-            for k, v in {
-                auth_header: token,
-                "User-Agent": compose_user_agent(caller_name, caller_version),
-                "Content-Type": "application/json",
-            }.items()
-            if v is not None
-        },
-        **additional_headers,
-    }
+    request_headers = compose_request_headers(
+        auth_header, token, caller_name, caller_version
+    )
+    request_headers.update(additional_headers)
+    content = encode_json_payload(json_data)
+    if compress and method == http_methods.POST:
+        content = compress_request_content(content, request_headers)
 
     # Log the parameters of the request accordingly
     log_request(method, f"{base_url}{path}", url_params, request_headers, json_data)
 
     # Make the request
-    r = client.request(
+    request = client.build_request(
         method=method,
         url=f"{base_url}{path}",
         params=url_params,
-        content=json.dumps(json_data, allow_nan=False, separators=(",", ":")).encode(),
+        content=content,
         timeout=timeout or DEFAULT_TIMEOUT,
         headers=request_headers,
     )
+    r = client.send(request, stream=stream)
 
-    # Log the response before returning it
-    log_response(r)
+    # Log the response before returning it (a streamed body is not read yet)
+    if not stream:
+        log_response(r)
 
     return r
 
@@ -242,6 +623,8 @@ async def amake_request(
     caller_version: Optional[str],
     timeout: Optional[Union[httpx.Timeout, float]],
     additional_headers: Dict[str, str],
+    compress: bool = False,
+    stream: bool = False,
 ) -> httpx.Response:
     """
     Make an HTTP request to a specified URL.
@@ -255,39 +638,39 @@ async def amake_request(
         path (str, optional): The specific path to append to the base URL.
         json_data (dict, optional): JSON payload to be sent with the request.
         url_params (dict, optional): URL parameters to be sent with the request.
+        compress (bool, optional): whether to gzip-compress large POST bodies.
+        stream (bool, optional): if True, the response body is not read: the
+            caller must then consume it (e.g. with `iter_bytes`) and close it.
 
     Returns:
         requests.Response: The response from the HTTP request.
     """
     # Build the request headers from the token and user agent
-    request_headers = {
-        **{
-            k: v
-            for k, v in {
-                auth_header: token,
-                "User-Agent": compose_user_agent(caller_name, caller_version),
-                "Content-Type": "application/json",
-            }.items()
-            if v is not None
-        },
-        **additional_headers,
-    }
+    request_headers = compose_request_headers(
+        auth_header, token, caller_name, caller_version
+    )
+    request_headers.update(additional_headers)
+    content = encode_json_payload(json_data)
+    if compress and method == http_methods.POST:
+        content = compress_request_content(content, request_headers)
 
     # Log the parameters of the request accordingly
     log_request(method, f"{base_url}{path}", url_params, request_headers, json_data)
 
     # Make the request
-    r = await client.request(
+    request = client.build_request(
         method=method,
         url=f"{base_url}{path}",
         params=url_params,
-        content=json.dumps(json_data, allow_nan=False, separators=(",", ":")).encode(),
+        content=content,
         timeout=timeout or DEFAULT_TIMEOUT,
         headers=request_headers,
     )
+    r = await client.send(request, stream=stream)
 
-    # Log the response before returning it
-    log_response(r)
+    # Log the response before returning it (a streamed body is not read yet)
+    if not stream:
+        log_response(r)
 
     return r
 
@@ -303,18 +686,10 @@ def make_payload(top_level: str, **kwargs: Any) -> Dict[str, Any]:
     Returns:
         dict: The constructed JSON payload.
     """
-    params = {}
-    for key, value in kwargs.items():
-        params[key] = value
-
-    json_query: Dict[str, Any] = {top_level: {}}
-
     # Adding keys only if they're provided
-    for key, value in params.items():
-        if value is not None:
-            json_query[top_level][key] = value
-
-    return json_query
+    return {
+        top_level: {key: value for key, value in kwargs.items() if value is not None}
+    }
 
 
 def convert_vector_to_floats(vector: Iterable[Any]) -> List[float]:
@@ -340,6 +715,34 @@ def is_list_of_floats(vector: Iterable[Any]) -> bool:
     )
 
 
+def is_serializable_numpy_vector(vector: Any) -> bool:
+    """
+    Determine if it's a numpy array that can be written as-is as a vector:
+    that is, one-dimensional, of floats, laid out contiguously in memory
+    and with `orjson` available to serialize it (numpy is not imported).
+    """
+    return (
+        ORJSON_AVAILABLE
+        and type(vector).__module__ == "numpy"
+        and getattr(vector, "ndim", None) == 1
+        and getattr(getattr(vector, "dtype", None), "kind", None) == "f"
+        and bool(vector.flags["C_CONTIGUOUS"])
+    )
+
+
+def is_finite_vector(vector: Any) -> bool:
+    """
+    Determine if all components of a (list or numpy) vector are finite.
+    (The check is needed as orjson would silently write NaN/inf as null.)
+    """
+    if isinstance(vector, list):
+        return all(map(math.isfinite, vector))
+    # a numpy array: numpy is already imported if one has been created
+    import numpy
+
+    return bool(numpy.isfinite(vector).all())
+
+
 def convert_to_ejson_date_object(
     date_value: Union[datetime.date, datetime.datetime]
 ) -> Dict[str, int]:
@@ -377,10 +780,11 @@ def _normalize_payload_value(path: List[str], value: Any) -> Any:
     _l2 = ".".join(path[-2:])
     _l1 = ".".join(path[-1:])
     if _l1 == "$vector" and _l2 != "projection.$vector":
-        if not is_list_of_floats(value):
-            return convert_vector_to_floats(value)
-        else:
-            return value
+        if not (is_list_of_floats(value) or is_serializable_numpy_vector(value)):
+            value = convert_vector_to_floats(value)
+        if not is_finite_vector(value):
+            raise ValueError("Out of range float values are not JSON compliant")
+        return value
     else:
         if isinstance(value, dict):
             return {
@@ -397,6 +801,9 @@ def _normalize_payload_value(path: List[str], value: Any) -> Any:
                 return convert_to_ejson_uuid_object(value)
             elif isinstance(value, ObjectId):
                 return convert_to_ejson_objectid_object(value)
+            elif isinstance(value, float) and not math.isfinite(value):
+                # (orjson would silently write these as null)
+                raise ValueError("Out of range float values are not JSON compliant")
             else:
                 return value
 
@@ -1143,11 +1143,18 @@ class AsyncDatabase:
         exc_value: Optional[BaseException] = None,
         traceback: Optional[TracebackType] = None,
     ) -> None:
-        await self._astra_db.__aexit__(
-            exc_type=exc_type,
-            exc_value=exc_value,
-            traceback=traceback,
-        )
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the HTTP client (and its connection pool) owned by this database.
+        Using the database afterwards transparently opens a new one.
+
+        Example:
+            >>> asyncio.run(my_async_db.close())
+        """
+
+        await self._astra_db.close()
 
     def _refresh_astra_db(self) -> AsyncAstraDB:
         """Re-instantiate a new (core) client based on the instance attributes."""
@@ -53,6 +53,7 @@ from .preprocess_env import (
     SECONDARY_NAMESPACE,
     TEST_ASTRADBOPS,
     TEST_SKIP_COLLECTION_DELETE,
+    TEST_STRICT_COUNTS,
 )
 
 
@@ -250,6 +251,7 @@ __all__ = [
     "SECONDARY_NAMESPACE",
     "TEST_ASTRADBOPS",
     "TEST_SKIP_COLLECTION_DELETE",
+    "TEST_STRICT_COUNTS",
     "ADMIN_ENV_LIST",
     "ADMIN_ENV_VARIABLE_MAP",
     "DO_IDIOMATIC_ADMIN_TESTS",
@@ -19,7 +19,7 @@ Test fixtures for 'core' testing
 from __future__ import annotations
 
 import math
-from typing import AsyncIterable, Dict, Iterable, List, Optional, Set, TypeVar
+from typing import Any, AsyncIterable, Dict, Iterable, List, Optional, Set, TypeVar
 
 import pytest
 import pytest_asyncio
@@ -111,7 +111,7 @@ def db(
     if token is None or api_endpoint is None:
         raise ValueError("Required ASTRA DB configuration is missing")
 
-    db_kwargs: Dict[str, str]
+    db_kwargs: Dict[str, Any]
     if data_api_credentials_info["environment"] in {"prod", "dev", "test"}:
         db_kwargs = {}
     else:
@@ -134,7 +134,7 @@ async def async_db(
     if token is None or api_endpoint is None:
         raise ValueError("Required ASTRA DB configuration is missing")
 
-    db_kwargs: Dict[str, str]
+    db_kwargs: Dict[str, Any]
     if data_api_credentials_info["environment"] in {"prod", "dev", "test"}:
         db_kwargs = {}
     else:
@@ -158,7 +158,7 @@ def invalid_db(
     api_endpoint = data_api_core_bad_credentials_kwargs["api_endpoint"]
     namespace = data_api_core_bad_credentials_kwargs.get("namespace")
 
-    db_kwargs: Dict[str, str]
+    db_kwargs: Dict[str, Any]
     if data_api_credentials_info["environment"] in {"prod", "dev", "test"}:
         db_kwargs = {}
     else:
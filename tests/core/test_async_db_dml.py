@@ -127,6 +127,29 @@ async def test_find_filter_novector(
     assert documents_n1[0]["_id"] in {"1", "2"}
 
 
+@pytest.mark.describe(
+    "find_pipelined, with results in the order of the filters (async)"
+)
+async def test_find_pipelined(
+    async_readonly_v_collection: AsyncAstraDBCollection,
+) -> None:
+    filters: List[Dict[str, Any]] = [
+        {"_id": "2"},
+        {"anotherfield": "alpha"},
+        {"_id": "no_such_id"},
+        {"_id": "1"},
+    ]
+    for concurrency in [1, 3]:
+        responses = await async_readonly_v_collection.find_pipelined(
+            filters, concurrency=concurrency
+        )
+        id_sets = [
+            {document["_id"] for document in response["data"]["documents"]}
+            for response in responses
+        ]
+        assert id_sets == [{"2"}, {"1", "2"}, set(), {"1"}]
+
+
 @pytest.mark.describe("obey projection in find and find_one (async)")
 async def test_find_find_one_projection(
     async_readonly_v_collection: AsyncAstraDBCollection,
@@ -80,6 +80,72 @@ def test_instance_equality_async() -> None:
     assert astradb_coll_a != astradb_coll_c
 
 
+@pytest.mark.describe("test sync collections share the database http client")
+def test_shared_http_client() -> None:
+    astradb = AstraDB(token="t1", api_endpoint="a1")
+    astradb_coll_a = astradb.collection("c1")
+    astradb_coll_b = AstraDBCollection("c2", token="t2", api_endpoint="a2")
+
+    assert astradb_coll_a.client is astradb.client
+    assert astradb_coll_b.client is astradb.client
+    assert astradb_coll_a.copy(collection_name="c3").client is astradb.client
+
+    pooled_astradb = AstraDB(token="t1", api_endpoint="a1", max_pool_size=5)
+    pooled_coll = pooled_astradb.collection("c1")
+    assert pooled_astradb.client is not astradb.client
+    assert pooled_coll.client is pooled_astradb.client
+    assert pooled_coll.copy(namespace="n2").client is pooled_astradb.client
+    assert pooled_astradb.copy(max_pool_size=6).client is not pooled_astradb.client
+
+    async_astradb = AsyncAstraDB(token="t1", api_endpoint="a1")
+    async_astradb_coll_a = AsyncAstraDBCollection("c1", astra_db=async_astradb)
+    async_astradb_coll_b = AsyncAstraDBCollection(
+        "c2", astra_db=async_astradb, namespace="n2"
+    )
+
+    assert async_astradb_coll_a.client is async_astradb.client
+    assert async_astradb_coll_b.client is async_astradb.client
+    assert async_astradb_coll_b.astra_db.client is async_astradb.client
+    assert async_astradb.copy(namespace="n3").client is async_astradb.client
+    assert async_astradb.copy(max_pool_size=6).client is not async_astradb.client
+
+
+@pytest.mark.describe("test sync dedicated http clients are closed by their owner")
+def test_sync_http_client_ownership() -> None:
+    with AstraDB(token="t1", api_endpoint="a1") as astradb:
+        pass
+    assert not AstraDB.client.is_closed
+    assert astradb.client is AstraDB.client
+
+    pooled_astradb = AstraDB(token="t1", api_endpoint="a1", max_pool_size=5)
+    pooled_copy = pooled_astradb.copy(namespace="n2")
+    pooled_copy.close()
+    assert not pooled_astradb.client.is_closed
+
+    with pooled_astradb:
+        pass
+    assert pooled_copy.client.is_closed
+
+
+@pytest.mark.describe("test async http client is created lazily, closed by its owner")
+async def test_async_http_client_ownership() -> None:
+    async_astradb = AsyncAstraDB(token="t1", api_endpoint="a1")
+    async_astradb_coll = AsyncAstraDBCollection("c1", astra_db=async_astradb)
+    assert async_astradb._client is None
+
+    client = async_astradb_coll.client
+    async with async_astradb_coll.astra_db:
+        pass
+    assert not client.is_closed
+
+    async with async_astradb:
+        pass
+    assert client.is_closed
+    assert not async_astradb_coll.client.is_closed
+    assert async_astradb_coll.client is async_astradb.client
+    await async_astradb.client.aclose()
+
+
 @pytest.mark.describe("test to_sync and to_async methods combine to identity")
 def test_round_conversion_is_noop() -> None:
     sync_astradb = AstraDB(
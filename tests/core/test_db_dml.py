@@ -123,6 +123,25 @@ def test_find_filter_novector(readonly_v_collection: AstraDBCollection) -> None:
     assert documents_n1[0]["_id"] in {"1", "2"}
 
 
+@pytest.mark.describe("find_pipelined, with results in the order of the filters")
+def test_find_pipelined(readonly_v_collection: AstraDBCollection) -> None:
+    filters: List[Dict[str, Any]] = [
+        {"_id": "2"},
+        {"anotherfield": "alpha"},
+        {"_id": "no_such_id"},
+        {"_id": "1"},
+    ]
+    for concurrency in [1, 3]:
+        responses = readonly_v_collection.find_pipelined(
+            filters, concurrency=concurrency
+        )
+        id_sets = [
+            {document["_id"] for document in response["data"]["documents"]}
+            for response in responses
+        ]
+        assert id_sets == [{"2"}, {"1", "2"}, set(), {"1"}]
+
+
 @pytest.mark.describe("obey projection in find and find_one")
 def test_find_find_one_projection(
     readonly_v_collection: AstraDBCollection,
@@ -0,0 +1,116 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tests for the streamed, incrementally-parsed find of the core collections
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from astrapy.core.api import APIRequestError
+from astrapy.core.db import AstraDBCollection, AsyncAstraDBCollection
+from astrapy.core.utils import IJSON_AVAILABLE, DocumentStreamParser
+
+DOCUMENTS = [
+    {"_id": "a", "x": 1.5, "sub": {"list": [1, {"y": None}]}},
+    {"_id": "b", "t": {"$date": 1700000000000}},
+]
+FIND_RESPONSE = {"data": {"documents": DOCUMENTS, "nextPageState": None}}
+ERROR_RESPONSE = {"errors": [{"message": "Oops", "errorCode": "OOPS"}]}
+
+
+def _feed_in_chunks(body: bytes, chunk_size: int) -> list[dict[str, object]]:
+    parser = DocumentStreamParser()
+    documents = []
+    for i in range(0, len(body), chunk_size):
+        documents += parser.feed(body[i : i + chunk_size])
+    documents += parser.close()
+    return documents
+
+
+@pytest.mark.describe("DocumentStreamParser reassembles documents and errors")
+@pytest.mark.parametrize(
+    "ijson_available",
+    [
+        pytest.param(
+            True,
+            marks=pytest.mark.skipif(not IJSON_AVAILABLE, reason="ijson missing"),
+        ),
+        False,
+    ],
+)
+def test_document_stream_parser(
+    ijson_available: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("astrapy.core.utils.IJSON_AVAILABLE", ijson_available)
+    body = json.dumps(FIND_RESPONSE).encode()
+    assert _feed_in_chunks(body, 7) == DOCUMENTS
+    assert _feed_in_chunks(body, len(body)) == DOCUMENTS
+
+    parser = DocumentStreamParser()
+    assert parser.feed(json.dumps(ERROR_RESPONSE).encode()) == []
+    assert parser.close() == []
+    assert parser.errors == ERROR_RESPONSE["errors"]
+
+    with pytest.raises(ValueError):
+        _feed_in_chunks(b'{"data": {"documents": [{"_id"', 5)
+
+
+@pytest.mark.describe("find_stream yields the documents of a find response")
+def test_find_stream(httpserver: HTTPServer) -> None:
+    root_endpoint = httpserver.url_for("/")
+    coll = AstraDBCollection("c1", token="t", api_endpoint=root_endpoint)
+    httpserver.expect_oneshot_request(
+        coll.base_path,
+        method="POST",
+        json={"find": {"filter": {"x": {"$gt": 1}}}},
+    ).respond_with_json(FIND_RESPONSE)
+
+    documents = list(coll.find_stream(filter={"x": {"$gt": 1}}))
+    assert [document["_id"] for document in documents] == ["a", "b"]
+    assert isinstance(documents[1]["t"], datetime.datetime)
+
+    httpserver.expect_oneshot_request(
+        coll.base_path,
+        method="POST",
+    ).respond_with_json(ERROR_RESPONSE)
+    with pytest.raises(APIRequestError) as exc:
+        list(coll.find_stream())
+    assert "Oops" in str(exc.value)
+
+
+@pytest.mark.describe("find_stream yields the documents of a find response (async)")
+async def test_find_stream_async(httpserver: HTTPServer) -> None:
+    root_endpoint = httpserver.url_for("/")
+    coll = AsyncAstraDBCollection("c1", token="t", api_endpoint=root_endpoint)
+    httpserver.expect_oneshot_request(
+        coll.base_path,
+        method="POST",
+    ).respond_with_json(FIND_RESPONSE)
+
+    documents = [document async for document in coll.find_stream()]
+    assert [document["_id"] for document in documents] == ["a", "b"]
+
+    httpserver.expect_oneshot_request(
+        coll.base_path,
+        method="POST",
+    ).respond_with_json(ERROR_RESPONSE)
+    with pytest.raises(APIRequestError):
+        [document async for document in coll.find_stream()]
@@ -0,0 +1,148 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tests for the automatic chunking of large insert_many calls in the core collections
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from astrapy.core.api import APIRequestError
+from astrapy.core.db import AstraDBCollection, AsyncAstraDBCollection
+from astrapy.core.defaults import DEFAULT_INSERT_NUM_DOCUMENTS, MAX_INSERT_NUM_DOCUMENTS
+
+NUM_DOCUMENTS = 5 * DEFAULT_INSERT_NUM_DOCUMENTS
+
+
+def _respond(request: Request) -> Response:
+    documents = request.json["insertMany"]["documents"]
+    assert len(documents) <= MAX_INSERT_NUM_DOCUMENTS
+    inserted_ids = [document["_id"] for document in documents]
+    return Response(json.dumps({"status": {"insertedIds": inserted_ids}}))
+
+
+def _respond_failing(request: Request) -> Response:
+    # the document with _id "bad" cannot be inserted (nor those after it)
+    ids = [document["_id"] for document in request.json["insertMany"]["documents"]]
+    if "bad" not in ids:
+        return Response(json.dumps({"status": {"insertedIds": ids}}))
+    return Response(
+        json.dumps(
+            {
+                "status": {"insertedIds": ids[: ids.index("bad")]},
+                "errors": [{"message": "bad document"}],
+            }
+        )
+    )
+
+
+@pytest.mark.describe("insert_many splits long lists into several requests")
+def test_insert_many_chunking(httpserver: HTTPServer) -> None:
+    root_endpoint = httpserver.url_for("/")
+    coll = AstraDBCollection("c1", token="t", api_endpoint=root_endpoint)
+    httpserver.expect_request(
+        coll.base_path,
+        method="POST",
+    ).respond_with_handler(_respond)
+
+    documents = [{"_id": i} for i in range(NUM_DOCUMENTS)]
+    response = coll.insert_many(documents)
+    assert len(httpserver.log) == NUM_DOCUMENTS // DEFAULT_INSERT_NUM_DOCUMENTS
+    assert sorted(response["status"]["insertedIds"]) == list(range(NUM_DOCUMENTS))
+
+    ordered_response = coll.insert_many(documents, options={"ordered": True})
+    assert ordered_response["status"]["insertedIds"] == list(range(NUM_DOCUMENTS))
+
+    coll.insert_many(documents[:MAX_INSERT_NUM_DOCUMENTS])
+    assert len(httpserver.log) == 2 * NUM_DOCUMENTS // DEFAULT_INSERT_NUM_DOCUMENTS + 1
+
+
+@pytest.mark.describe("insert_many splits long lists into several requests (async)")
+async def test_insert_many_chunking_async(httpserver: HTTPServer) -> None:
+    root_endpoint = httpserver.url_for("/")
+    coll = AsyncAstraDBCollection("c1", token="t", api_endpoint=root_endpoint)
+    httpserver.expect_request(
+        coll.base_path,
+        method="POST",
+    ).respond_with_handler(_respond)
+
+    documents = [{"_id": i} for i in range(NUM_DOCUMENTS)]
+    response = await coll.insert_many(documents)
+    assert len(httpserver.log) == NUM_DOCUMENTS // DEFAULT_INSERT_NUM_DOCUMENTS
+    assert sorted(response["status"]["insertedIds"]) == list(range(NUM_DOCUMENTS))
+
+
+@pytest.mark.describe("chunked insert_many handles failures in some of the chunks")
+def test_insert_many_chunking_failures(httpserver: HTTPServer) -> None:
+    root_endpoint = httpserver.url_for("/")
+    coll = AstraDBCollection("c1", token="t", api_endpoint=root_endpoint)
+    httpserver.expect_request(
+        coll.base_path,
+        method="POST",
+    ).respond_with_handler(_respond_failing)
+
+    bad_index = DEFAULT_INSERT_NUM_DOCUMENTS + 1
+    documents: List[Dict[str, Any]] = [{"_id": i} for i in range(NUM_DOCUMENTS)]
+    documents[bad_index] = {"_id": "bad"}
+
+    # ordered: the chunks after the failing one are not sent
+    ordered_response = coll.insert_many(
+        documents, options={"ordered": True}, partial_failures_allowed=True
+    )
+    assert len(httpserver.log) == 2
+    assert ordered_response["status"]["insertedIds"] == list(range(bad_index))
+    assert ordered_response["errors"] == [{"message": "bad document"}]
+
+    # unordered, no partial failures: the other chunks are still reported
+    with pytest.raises(APIRequestError) as exc_info:
+        coll.insert_many(documents)
+    assert exc_info.value.partial_response is not None
+    inserted_ids = exc_info.value.partial_response["status"]["insertedIds"]
+    assert len(inserted_ids) == NUM_DOCUMENTS - DEFAULT_INSERT_NUM_DOCUMENTS
+
+
+@pytest.mark.describe(
+    "chunked insert_many handles failures in some of the chunks (async)"
+)
+async def test_insert_many_chunking_failures_async(httpserver: HTTPServer) -> None:
+    root_endpoint = httpserver.url_for("/")
+    coll = AsyncAstraDBCollection("c1", token="t", api_endpoint=root_endpoint)
+    httpserver.expect_request(
+        coll.base_path,
+        method="POST",
+    ).respond_with_handler(_respond_failing)
+
+    bad_index = DEFAULT_INSERT_NUM_DOCUMENTS + 1
+    documents: List[Dict[str, Any]] = [{"_id": i} for i in range(NUM_DOCUMENTS)]
+    documents[bad_index] = {"_id": "bad"}
+
+    ordered_response = await coll.insert_many(
+        documents, options={"ordered": True}, partial_failures_allowed=True
+    )
+    assert len(httpserver.log) == 2
+    assert ordered_response["status"]["insertedIds"] == list(range(bad_index))
+    assert ordered_response["errors"] == [{"message": "bad document"}]
+
+    with pytest.raises(APIRequestError) as exc_info:
+        await coll.insert_many(documents)
+    assert exc_info.value.partial_response is not None
+    inserted_ids = exc_info.value.partial_response["status"]["insertedIds"]
+    assert len(inserted_ids) == NUM_DOCUMENTS - DEFAULT_INSERT_NUM_DOCUMENTS
@@ -0,0 +1,178 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tests for the opt-in caching of read responses in the core collections
+"""
+
+from __future__ import annotations
+
+import json
+import time
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from astrapy.core.db import AstraDBCollection, AsyncAstraDBCollection
+from astrapy.core.utils import ResponseCache
+
+FIND_ONE_RESPONSE = {"data": {"document": {"_id": "x", "a": 1}}}
+INSERT_ONE_RESPONSE = {"status": {"insertedIds": ["y"]}}
+
+
+def _respond(request: Request) -> Response:
+    if "findOne" in request.json:
+        return Response(json.dumps(FIND_ONE_RESPONSE))
+    else:
+        return Response(json.dumps(INSERT_ONE_RESPONSE))
+
+
+@pytest.mark.describe("ResponseCache honors TTL, max size and returns copies")
+def test_response_cache_class() -> None:
+    cache = ResponseCache(ttl=0.2, max_size=2)
+    cache.set("k1", {"a": 1})
+    cache.set("k2", {"a": 2})
+    retrieved = cache.get("k1")
+    assert retrieved == {"a": 1}
+    assert retrieved is not None
+    retrieved["a"] = 100
+    assert cache.get("k1") == {"a": 1}
+    # k1 was used most recently, k2 gets evicted
+    cache.set("k3", {"a": 3})
+    assert cache.get("k2") is None
+    assert cache.get("k3") == {"a": 3}
+    time.sleep(0.3)
+    assert cache.get("k1") is None
+    cache.set("k4", {"a": 4})
+    cache.clear()
+    assert cache.get("k4") is None
+    # responses to requests issued before a clear are not stored
+    generation = cache.generation
+    cache.clear()
+    cache.set("k5", {"a": 5}, generation=generation)
+    assert cache.get("k5") is None
+    cache.set("k5", {"a": 5}, generation=cache.generation)
+    assert cache.get("k5") == {"a": 5}
+
+
+@pytest.mark.describe("find_one responses are cached only if requested")
+def test_find_one_response_cache(httpserver: HTTPServer) -> None:
+    root_endpoint = httpserver.url_for("/")
+    coll_nocache = AstraDBCollection("c1", token="t", api_endpoint=root_endpoint)
+    coll = coll_nocache.copy(cache_ttl=60)
+    expected_url = coll.base_path
+    httpserver.expect_request(
+        expected_url,
+        method="POST",
+    ).respond_with_handler(_respond)
+
+    coll_nocache.find_one(filter={"_id": "x"})
+    coll_nocache.find_one(filter={"_id": "x"})
+    assert len(httpserver.log) == 2
+
+    assert coll.find_one(filter={"_id": "x"}) == FIND_ONE_RESPONSE
+    assert coll.find_one(filter={"_id": "x"}) == FIND_ONE_RESPONSE
+    assert len(httpserver.log) == 3
+
+    # a write invalidates the cache
+    coll.insert_one({"_id": "y"})
+    assert len(httpserver.log) == 4
+    coll.find_one(filter={"_id": "x"})
+    assert len(httpserver.log) == 5
+
+    # caching can be switched off in copies, and set when spawning collections
+    assert coll.copy(cache_ttl=None)._response_cache is None
+    assert coll.copy()._response_cache is not None
+    assert coll.astra_db.collection("c2", cache_ttl=60).cache_ttl == 60
+
+
+@pytest.mark.describe("find_one responses are cached only if requested (async)")
+async def test_find_one_response_cache_async(httpserver: HTTPServer) -> None:
+    root_endpoint = httpserver.url_for("/")
+    coll = AsyncAstraDBCollection(
+        "c1", token="t", api_endpoint=root_endpoint, cache_ttl=60
+    )
+    expected_url = coll.base_path
+    httpserver.expect_request(
+        expected_url,
+        method="POST",
+    ).respond_with_handler(_respond)
+
+    assert await coll.find_one(filter={"_id": "x"}) == FIND_ONE_RESPONSE
+    assert await coll.find_one(filter={"_id": "x"}) == FIND_ONE_RESPONSE
+    assert len(httpserver.log) == 1
+
+    await coll.insert_one({"_id": "y"})
+    await coll.find_one(filter={"_id": "x"})
+    assert len(httpserver.log) == 3
+
+
+@pytest.mark.describe("get revalidates cached responses with their ETag")
+def test_get_etag_revalidation(httpserver: HTTPServer) -> None:
+    root_endpoint = httpserver.url_for("/")
+    coll = AstraDBCollection("c1", token="t", api_endpoint=root_endpoint, cache_ttl=60)
+    expected_url = coll.base_path + "/doc"
+    body = {"data": {"document": {"_id": "doc"}}}
+
+    def _respond(request: Request) -> Response:
+        if request.headers.get("If-None-Match") == '"v1"':
+            return Response(status=304, headers={"ETag": '"v1"'})
+        return Response(json.dumps(body), headers={"ETag": '"v1"'})
+
+    httpserver.expect_request(
+        expected_url,
+        method="GET",
+    ).respond_with_handler(_respond)
+
+    assert coll.get(path="doc") == body
+    assert coll.get(path="doc") == body
+    assert len(httpserver.log) == 1
+
+    # once the TTL-cached entry is gone, the ETag is used to revalidate
+    assert coll._response_cache is not None
+    coll._response_cache.clear()
+    assert coll.get(path="doc") == body
+    assert len(httpserver.log) == 2
+    assert httpserver.log[1][0].headers["If-None-Match"] == '"v1"'
+
+    coll.invalidate_cache()
+    assert coll.get(path="doc") == body
+    assert len(httpserver.log) == 3
+    assert "If-None-Match" not in httpserver.log[2][0].headers
+
+
+@pytest.mark.describe("get revalidates cached responses with their ETag (async)")
+async def test_get_etag_revalidation_async(httpserver: HTTPServer) -> None:
+    root_endpoint = httpserver.url_for("/")
+    coll = AsyncAstraDBCollection(
+        "c1", token="t", api_endpoint=root_endpoint, cache_ttl=60
+    )
+    expected_url = coll.base_path + "/doc"
+    body = {"data": {"document": {"_id": "doc"}}}
+    httpserver.expect_oneshot_request(
+        expected_url,
+        method="GET",
+    ).respond_with_response(Response(json.dumps(body), headers={"ETag": '"v1"'}))
+    httpserver.expect_oneshot_request(
+        expected_url,
+        method="GET",
+        headers={"If-None-Match": '"v1"'},
+    ).respond_with_response(Response(status=304))
+
+    assert await coll.get(path="doc") == body
+    assert coll._response_cache is not None
+    coll._response_cache.clear()
+    assert await coll.get(path="doc") == body
+    assert len(httpserver.log) == 2
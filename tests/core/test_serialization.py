@@ -0,0 +1,186 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the JSON encoding/decoding of request and response bodies
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import gzip
+import json
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from astrapy.core.db import AstraDB, AstraDBCollection
+from astrapy.core.defaults import DEFAULT_REQUEST_COMPRESSION_MIN_BYTES
+from astrapy.core.utils import (
+    _has_wide_integer,
+    compress_request_content,
+    decode_json_response,
+    encode_json_payload,
+    normalize_for_api,
+)
+
+
+@pytest.mark.describe("encode_json_payload produces compact JSON bytes")
+def test_encode_json_payload() -> None:
+    payload = {"insertOne": {"document": {"a": 1, "b": [0.5, "x", None, True]}}}
+    encoded = encode_json_payload(payload)
+    assert isinstance(encoded, bytes)
+    assert encoded == json.dumps(payload, separators=(",", ":")).encode()
+    assert encode_json_payload(None) == b"null"
+
+
+@pytest.mark.describe("encode_json_payload handles what orjson cannot")
+def test_encode_json_payload_fallback() -> None:
+    huge = {"n": 2**70}
+    assert json.loads(encode_json_payload(huge)) == huge
+
+
+@pytest.mark.describe("encode_json_payload rejects what the standard library rejects")
+def test_encode_json_payload_unsupported_types() -> None:
+    @dataclasses.dataclass
+    class Point:
+        x: int
+
+    for value in [
+        datetime.datetime(2000, 1, 1),
+        datetime.date(2000, 1, 1),
+        Point(x=1),
+        object(),
+    ]:
+        with pytest.raises(TypeError):
+            encode_json_payload({"insertOne": {"document": {"a": value}}})
+
+
+@pytest.mark.describe("non-finite floats are rejected before serialization")
+def test_normalize_rejects_nonfinite_floats() -> None:
+    with pytest.raises(ValueError):
+        normalize_for_api({"find": {"filter": {"a": float("nan")}}})
+    with pytest.raises(ValueError):
+        normalize_for_api({"find": {"filter": {"a": float("inf")}}})
+    with pytest.raises(ValueError):
+        normalize_for_api({"insertOne": {"document": {"$vector": [float("nan"), 0.2]}}})
+    with pytest.raises(ValueError):
+        normalize_for_api({"find": {"sort": {"$vector": (0.1, float("-inf"))}}})
+
+
+@pytest.mark.describe("decode_json_response parses bytes and errors on bad bodies")
+def test_decode_json_response() -> None:
+    assert decode_json_response(b'{"data":{"documents":[{"_id":"x"}]}}') == {
+        "data": {"documents": [{"_id": "x"}]}
+    }
+    # integers beyond 64 bits are not turned into floats
+    assert decode_json_response(b'{"n":123456789012345678901234567890}') == {
+        "n": 123456789012345678901234567890
+    }
+    assert decode_json_response(b"[1.5,-12345678901234567890]") == [
+        1.5,
+        -12345678901234567890,
+    ]
+    # long digit strings within text are not mistaken for integers
+    assert not _has_wide_integer(b'{"_id":"12345678901234567890","n":1.0}')
+    assert not _has_wide_integer(b'{"s":"a\\"12345678901234567890\\""}')
+    assert not _has_wide_integer(b'{"x":0.12345678901234567890123}')
+    assert _has_wide_integer(b'{"s":"x","n":12345678901234567890}')
+    with pytest.raises(ValueError):
+        decode_json_response(b"")
+    with pytest.raises(ValueError):
+        decode_json_response(b"<html>")
+
+
+@pytest.mark.describe("compress_request_content gzips only large enough bodies")
+def test_compress_request_content() -> None:
+    small_body = b"x" * DEFAULT_REQUEST_COMPRESSION_MIN_BYTES
+    headers0: dict[str, str] = {}
+    assert compress_request_content(small_body, headers0) == small_body
+    assert "Content-Encoding" not in headers0
+
+    large_body = small_body + b"x"
+    headers1: dict[str, str] = {}
+    compressed = compress_request_content(large_body, headers1)
+    assert headers1["Content-Encoding"] == "gzip"
+    assert gzip.decompress(compressed) == large_body
+
+
+@pytest.mark.describe("AstraDB with compress=True sends gzipped insert_many bodies")
+def test_compressed_insert_many(httpserver: HTTPServer) -> None:
+    root_endpoint = httpserver.url_for("/")
+    astra_db = AstraDB(token="t", api_endpoint=root_endpoint, compress=True)
+    coll = AstraDBCollection("c1", astra_db=astra_db)
+    assert coll.copy().astra_db.compress
+    assert coll.to_async().astra_db.compress
+
+    def _respond(request: Request) -> Response:
+        assert request.headers["Content-Encoding"] == "gzip"
+        payload = json.loads(gzip.decompress(request.get_data()))
+        documents = payload["insertMany"]["documents"]
+        inserted_ids = [document["_id"] for document in documents]
+        return Response(json.dumps({"status": {"insertedIds": inserted_ids}}))
+
+    httpserver.expect_request(
+        coll.base_path,
+        method="POST",
+    ).respond_with_handler(_respond)
+
+    documents = [{"_id": i, "text": "lorem ipsum " * 10} for i in range(20)]
+    response = coll.insert_many(documents)
+    assert response["status"]["insertedIds"] == list(range(20))
+
+
+@pytest.mark.describe("numpy vectors are serialized without conversion to lists")
+@pytest.mark.parametrize("orjson_available", [True, False])
+def test_numpy_vector_serialization(
+    orjson_available: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    np = pytest.importorskip("numpy")
+    if orjson_available:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr("astrapy.core.utils.ORJSON_AVAILABLE", orjson_available)
+    vector = np.array([0.25, 0.5, -1.0], dtype=np.float32)
+    payload = {"insertOne": {"document": {"_id": "x", "$vector": vector}}}
+    normalized = normalize_for_api(payload)
+    assert normalized is not None
+    normalized_vector = normalized["insertOne"]["document"]["$vector"]
+    assert (normalized_vector is vector) == orjson_available
+    assert json.loads(encode_json_payload(normalized)) == {
+        "insertOne": {"document": {"_id": "x", "$vector": [0.25, 0.5, -1.0]}}
+    }
+    # non-contiguous arrays are still converted
+    strided = normalize_for_api({"find": {"sort": {"$vector": vector[::2]}}})
+    assert strided == {"find": {"sort": {"$vector": [0.25, -1.0]}}}
+    # non-finite components are rejected
+    with pytest.raises(ValueError):
+        nan_vector = np.array([0.5, np.nan], dtype=np.float32)
+        normalize_for_api({"find": {"sort": {"$vector": nan_vector}}})
+
+
+@pytest.mark.describe("insert_one can take the vector as a separate argument")
+def test_insert_one_vector(httpserver: HTTPServer) -> None:
+    root_endpoint = httpserver.url_for("/")
+    coll = AstraDBCollection("c1", token="t", api_endpoint=root_endpoint)
+    httpserver.expect_oneshot_request(
+        coll.base_path,
+        method="POST",
+        json={"insertOne": {"document": {"_id": "x", "$vector": [0.5, 1.5]}}},
+    ).respond_with_json({"status": {"insertedIds": ["x"]}})
+
+    document = {"_id": "x"}
+    coll.insert_one(document, vector=[0.5, 1.5])
+    assert document == {"_id": "x"}
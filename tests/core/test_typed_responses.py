@@ -0,0 +1,88 @@
+# Copyright DataStax, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tests for the typed (msgspec-decoded) find responses of the core collections
+"""
+
+from __future__ import annotations
+
+import datetime
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from astrapy.core.api import APIRequestError
+from astrapy.core.db import AstraDBCollection, AsyncAstraDBCollection
+
+pytest.importorskip("msgspec")
+
+FIND_RESPONSE = {
+    "data": {
+        "documents": [{"_id": "a"}, {"_id": "b", "t": {"$date": 1700000000000}}],
+        "nextPageState": "xyz",
+    }
+}
+FIND_ONE_RESPONSE = {"data": {"document": None}}
+ERROR_RESPONSE = {"errors": [{"message": "Oops", "errorCode": "OOPS"}]}
+
+
+@pytest.mark.describe("find_typed and find_one_typed decode into structs")
+def test_typed_responses(httpserver: HTTPServer) -> None:
+    root_endpoint = httpserver.url_for("/")
+    coll = AstraDBCollection("c1", token="t", api_endpoint=root_endpoint)
+    httpserver.expect_oneshot_request(
+        coll.base_path,
+        method="POST",
+        json={"find": {"filter": {"_id": {"$in": ["a", "b"]}}}},
+    ).respond_with_json(FIND_RESPONSE)
+    httpserver.expect_oneshot_request(
+        coll.base_path,
+        method="POST",
+        json={"findOne": {}},
+    ).respond_with_json(FIND_ONE_RESPONSE)
+    httpserver.expect_oneshot_request(
+        coll.base_path,
+        method="POST",
+    ).respond_with_json(ERROR_RESPONSE)
+
+    response = coll.find_typed(filter={"_id": {"$in": ["a", "b"]}})
+    assert [document["_id"] for document in response.data.documents] == ["a", "b"]
+    assert isinstance(response.data.documents[1]["t"], datetime.datetime)
+    assert response.data.nextPageState == "xyz"
+
+    assert coll.find_one_typed().data.document is None
+
+    with pytest.raises(APIRequestError):
+        coll.find_typed()
+
+
+@pytest.mark.describe("find_typed and find_one_typed decode into structs (async)")
+async def test_typed_responses_async(httpserver: HTTPServer) -> None:
+    root_endpoint = httpserver.url_for("/")
+    coll = AsyncAstraDBCollection("c1", token="t", api_endpoint=root_endpoint)
+    httpserver.expect_oneshot_request(
+        coll.base_path,
+        method="POST",
+    ).respond_with_json(FIND_RESPONSE)
+    httpserver.expect_oneshot_request(
+        coll.base_path,
+        method="POST",
+    ).respond_with_json(ERROR_RESPONSE)
+
+    response = await coll.find_typed()
+    assert len(response.data.documents) == 2
+
+    with pytest.raises(APIRequestError):
+        await coll.find_one_typed()
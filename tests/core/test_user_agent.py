@@ -31,7 +31,12 @@ from astrapy.core.db import (
     AsyncAstraDBCollection,
 )
 from astrapy.core.ops import AstraDBOps
-from astrapy.core.utils import compose_user_agent, package_name
+from astrapy.core.utils import (
+    compose_common_request_headers,
+    compose_request_headers,
+    compose_user_agent,
+    package_name,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +61,23 @@ def test_compose_user_agent() -> None:
     )
 
 
+@pytest.mark.describe("compose_request_headers")
+def test_compose_request_headers() -> None:
+    headers = compose_request_headers("Token", "t", "N", "V")
+    assert headers == {
+        "Token": "t",
+        "User-Agent": compose_user_agent("N", "V"),
+        "Content-Type": "application/json",
+    }
+    assert "Token" not in compose_request_headers("Token", None, "N", "V")
+    # the token-independent part is computed once, and read-only
+    common_headers = compose_common_request_headers("N", "V")
+    assert compose_common_request_headers("N", "V") is common_headers
+    assert "Token" not in common_headers
+    with pytest.raises(TypeError):
+        common_headers["User-Agent"] = "x"  # type: ignore[index]
+
+
 @pytest.mark.describe("test user-agent for AstraDB")
 def test_useragent_astradb(httpserver: HTTPServer) -> None:
     root_endpoint = httpserver.url_for("/")
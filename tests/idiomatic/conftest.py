@@ -16,9 +16,11 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+import os
+from typing import AsyncIterable, Iterable
 
 import pytest
+import pytest_asyncio
 
 from astrapy import AsyncCollection, AsyncDatabase, Collection, DataAPIClient, Database
 from astrapy.constants import VectorMetric
@@ -29,6 +31,7 @@ from ..conftest import (
     DO_IDIOMATIC_ADMIN_TESTS,
     IS_ASTRA_DB,
     SECONDARY_NAMESPACE,
+    TEST_STRICT_COUNTS,
     DataAPICredentials,
     DataAPICredentialsInfo,
     async_fail_if_not_removed,
@@ -36,7 +39,11 @@ from ..conftest import (
 )
 
 TEST_COLLECTION_INSTANCE_NAME = "test_coll_instance"
-TEST_COLLECTION_NAME = "id_test_collection"
+# each pytest-xdist worker (if any) gets its own collection to work on
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+TEST_COLLECTION_NAME = (
+    f"id_test_collection_{_XDIST_WORKER}" if _XDIST_WORKER else "id_test_collection"
+)
 
 
 @pytest.fixture(scope="session")
@@ -119,12 +126,29 @@ def async_collection(
     yield sync_collection.to_async()
 
 
+@pytest_asyncio.fixture(scope="module")
+async def async_module_collection(
+    sync_collection: Collection,
+) -> AsyncIterable[AsyncCollection]:
+    """
+    The async counterpart of the collection, shared by the tests of a module:
+    its HTTP/2 connection pool stays open across tests, and is closed at the end.
+    Modules using it must run all tests in the module-scoped event loop,
+    i.e. set `pytestmark = pytest.mark.asyncio(scope="module")`.
+    """
+    # the collection uses (and closing the database closes) the database's client
+    async with sync_collection.database.to_async() as async_database:
+        yield sync_collection.to_async(database=async_database)
+
+
 @pytest.fixture(scope="function")
 def async_empty_collection(
-    sync_empty_collection: Collection,
+    sync_collection: Collection,
+    async_module_collection: AsyncCollection,
 ) -> Iterable[AsyncCollection]:
     """Emptied for each test function"""
-    yield sync_empty_collection.to_async()
+    sync_collection.delete_many({})
+    yield async_module_collection
 
 
 __all__ = [
@@ -139,4 +163,5 @@ __all__ = [
     "ADMIN_ENV_VARIABLE_MAP",
     "DO_IDIOMATIC_ADMIN_TESTS",
     "SECONDARY_NAMESPACE",
+    "TEST_STRICT_COUNTS",
 ]
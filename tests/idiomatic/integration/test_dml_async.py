@@ -14,8 +14,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import pytest
 
@@ -35,7 +36,83 @@ from astrapy.operations import (
 )
 from astrapy.results import DeleteResult, InsertOneResult
 
-from ..conftest import async_fail_if_not_removed
+from ..conftest import TEST_STRICT_COUNTS, async_fail_if_not_removed
+
+# all tests share the module-scoped async_empty_collection and its pool
+pytestmark = pytest.mark.asyncio(scope="module")
+
+# cap on concurrent requests for the largest inserts, not to overwhelm the server
+BULK_INSERT_CONCURRENCY = 4
+
+# parameters of the find-pattern matrix
+FIND_SKIP = 1
+FIND_LIMIT = 28
+
+# one id of each supported type, for the tests on ids
+TYPES_AND_IDS = {
+    "uuid1": UUID("8ccd6ff8-e61b-11ee-a2fc-7df4a8c4164b"),
+    "uuid3": UUID("6fa459ea-ee8a-3ca4-894e-db77e160355e"),
+    "uuid4": UUID("4f16cba8-1115-43ab-aa39-3a9c29f37db5"),
+    "uuid5": UUID("886313e1-3b8a-5372-9b90-0c9aee199e5d"),
+    "uuid6": UUID("1eee61b9-8f2d-69ad-8ebb-5054d2a1a2c0"),
+    "uuid7": UUID("018e57e5-f586-7ed6-be55-6b0de3041116"),
+    "uuid8": UUID("018e57e5-fbcd-8bd4-b794-be914f2c4c85"),
+    "objectid": ObjectId("65f9cfa0d7fabb3f255c25a1"),
+}
+
+
+async def _alist(acursor: AsyncCursor) -> List[DocumentType]:
+    return [doc async for doc in acursor]
+
+
+async def _advance(acursor: AsyncCursor, steps: int) -> List[DocumentType]:
+    return [await acursor.__anext__() for _ in range(steps)]
+
+
+async def _acount(acursor: AsyncCursor, upper_bound: Optional[int] = None) -> int:
+    """
+    Count the documents from a cursor. With an upper bound, reading stops
+    (and the cursor is closed) as soon as it is exceeded.
+    """
+    count = 0
+    async for _ in acursor:
+        count += 1
+        if upper_bound is not None and count > upper_bound:
+            acursor.close()
+            break
+    return count
+
+
+def _find_case_kwargs(case_id: str) -> Dict[str, Any]:
+    """
+    The `find` parameters for a case of the find-pattern matrix, identified by
+    four binary digits switching skip, limit, sort and filter on/off in turn.
+    Built anew at each call, as the concurrent calls receiving the parameters
+    must not share the (mutable) sort and filter dictionaries.
+    """
+    skip_on, limit_on, sort_on, filter_on = (digit == "1" for digit in case_id)
+    return {
+        "skip": FIND_SKIP if skip_on else None,
+        "limit": FIND_LIMIT if limit_on else None,
+        "sort": {"seq": SortDocuments.DESCENDING} if sort_on else None,
+        "filter": {"seq": {"$exists": True}} if filter_on else None,
+    }
+
+
+def _find_one_and_case_kwargs(case_id: str) -> Dict[str, Any]:
+    """
+    The options for a case of the find_one_and_* matrices, identified by four
+    binary digits switching on/off, in turn: return_document=AFTER, presence
+    of a matching document (not an option: it depends on the seeding), upsert
+    and sort. Built anew at each call, as the concurrent calls receiving the
+    options must not share the (mutable) sort dictionary.
+    """
+    is_after, _, is_upsert, is_sorted = (digit == "1" for digit in case_id)
+    return {
+        "upsert": is_upsert,
+        "sort": {"x": 1} if is_sorted else None,
+        "return_document": ReturnDocument.AFTER if is_after else ReturnDocument.BEFORE,
+    }
 
 
 class TestDMLAsync:
@@ -48,9 +125,13 @@ class TestDMLAsync:
             await async_empty_collection.count_documents(filter={}, upper_bound=100)
             == 0
         )
-        await async_empty_collection.insert_one({"doc": 1, "group": "A"})
-        await async_empty_collection.insert_one({"doc": 2, "group": "B"})
-        await async_empty_collection.insert_one({"doc": 3, "group": "A"})
+        await async_empty_collection.insert_many(
+            [
+                {"doc": 1, "group": "A"},
+                {"doc": 2, "group": "B"},
+                {"doc": 3, "group": "A"},
+            ]
+        )
         assert (
             await async_empty_collection.count_documents(filter={}, upper_bound=100)
             == 3
@@ -67,9 +148,13 @@ class TestDMLAsync:
         self,
         async_empty_collection: AsyncCollection,
     ) -> None:
-        await async_empty_collection.insert_one({"doc": 1, "group": "A"})
-        await async_empty_collection.insert_one({"doc": 2, "group": "B"})
-        await async_empty_collection.insert_one({"doc": 3, "group": "A"})
+        await async_empty_collection.insert_many(
+            [
+                {"doc": 1, "group": "A"},
+                {"doc": 2, "group": "B"},
+                {"doc": 3, "group": "A"},
+            ]
+        )
         count = await async_empty_collection.estimated_document_count()
         # it's _estimated_, no precise expectation with such short sizes/times
         assert isinstance(count, int)
@@ -80,7 +165,9 @@ class TestDMLAsync:
         self,
         async_empty_collection: AsyncCollection,
     ) -> None:
-        await async_empty_collection.insert_many([{"a": i} for i in range(900)])
+        await async_empty_collection.insert_many(
+            [{"a": i} for i in range(900)], concurrency=BULK_INSERT_CONCURRENCY
+        )
         assert (
             await async_empty_collection.count_documents(filter={}, upper_bound=950)
             == 900
@@ -93,7 +180,9 @@ class TestDMLAsync:
             await async_empty_collection.count_documents(
                 filter={}, upper_bound=100
             ) == 900
-        await async_empty_collection.insert_many([{"b": i} for i in range(200)])
+        await async_empty_collection.insert_many(
+            [{"b": i} for i in range(200)], concurrency=BULK_INSERT_CONCURRENCY
+        )
         with pytest.raises(ValueError):
             assert await async_empty_collection.count_documents(
                 filter={}, upper_bound=100
@@ -127,17 +216,16 @@ class TestDMLAsync:
         async_empty_collection: AsyncCollection,
     ) -> None:
         with pytest.warns(DeprecationWarning):
-            await async_empty_collection.insert_one({"tag": "v1"}, vector=[-1, -2])
-        retrieved1 = await async_empty_collection.find_one(
-            {"tag": "v1"}, projection={"*": 1}
+            await asyncio.gather(
+                async_empty_collection.insert_one({"tag": "v1"}, vector=[-1, -2]),
+                async_empty_collection.insert_one({"tag": "v2", "$vector": [-3, -4]}),
+            )
+        retrieved1, retrieved2 = await asyncio.gather(
+            async_empty_collection.find_one({"tag": "v1"}, projection={"*": 1}),
+            async_empty_collection.find_one({"tag": "v2"}, projection={"*": 1}),
         )
         assert retrieved1 is not None
         assert retrieved1["$vector"] == [-1, -2]
-
-        await async_empty_collection.insert_one({"tag": "v2", "$vector": [-3, -4]})
-        retrieved2 = await async_empty_collection.find_one(
-            {"tag": "v2"}, projection={"*": 1}
-        )
         assert retrieved2 is not None
         assert retrieved2["$vector"] == [-3, -4]
 
@@ -152,20 +240,17 @@ class TestDMLAsync:
         self,
         async_empty_collection: AsyncCollection,
     ) -> None:
-        await async_empty_collection.insert_one({"doc": 1, "group": "A"})
-        await async_empty_collection.insert_one({"doc": 2, "group": "B"})
-        await async_empty_collection.insert_one({"doc": 3, "group": "A"})
-        assert (
-            await async_empty_collection.count_documents(filter={}, upper_bound=100)
-            == 3
+        im_result = await async_empty_collection.insert_many(
+            [
+                {"doc": 1, "group": "A"},
+                {"doc": 2, "group": "B"},
+                {"doc": 3, "group": "A"},
+            ]
         )
+        assert len(im_result.inserted_ids) == 3
         do_result1 = await async_empty_collection.delete_one({"group": "A"})
         assert isinstance(do_result1, DeleteResult)
         assert do_result1.deleted_count == 1
-        assert (
-            await async_empty_collection.count_documents(filter={}, upper_bound=100)
-            == 2
-        )
 
         # test of sort
         await async_empty_collection.insert_many(
@@ -182,26 +267,17 @@ class TestDMLAsync:
         self,
         async_empty_collection: AsyncCollection,
     ) -> None:
-        await async_empty_collection.insert_one({"doc": 1, "group": "A"})
-        await async_empty_collection.insert_one({"doc": 2, "group": "B"})
-        await async_empty_collection.insert_one({"doc": 3, "group": "A"})
-        assert (
-            await async_empty_collection.count_documents(filter={}, upper_bound=100)
-            == 3
+        im_result = await async_empty_collection.insert_many(
+            [
+                {"doc": 1, "group": "A"},
+                {"doc": 2, "group": "B"},
+                {"doc": 3, "group": "A"},
+            ]
         )
+        assert len(im_result.inserted_ids) == 3
         do_result1 = await async_empty_collection.delete_many({"group": "A"})
         assert isinstance(do_result1, DeleteResult)
         assert do_result1.deleted_count == 2
-        assert (
-            await async_empty_collection.count_documents(filter={}, upper_bound=100)
-            == 1
-        )
-
-        await async_empty_collection.delete_many({})
-        await async_empty_collection.insert_many([{"a": 1} for _ in range(50)])
-        do_result2 = await async_empty_collection.delete_many({"a": 1})
-        assert do_result2.deleted_count == 50
-        assert await async_empty_collection.count_documents({}, upper_bound=100) == 0
 
         await async_empty_collection.delete_many({})
         await async_empty_collection.insert_many([{"a": 1} for _ in range(50)])
@@ -215,11 +291,10 @@ class TestDMLAsync:
         self,
         async_empty_collection: AsyncCollection,
     ) -> None:
-        await async_empty_collection.insert_many([{"a": 1}, {"a": 2}, {"a": 3}])
-        assert (
-            await async_empty_collection.count_documents(filter={}, upper_bound=100)
-            == 3
+        im_result = await async_empty_collection.insert_many(
+            [{"a": 1}, {"a": 2}, {"a": 3}]
         )
+        assert len(im_result.inserted_ids) == 3
         await async_empty_collection.delete_all()
         assert (
             await async_empty_collection.count_documents(filter={}, upper_bound=100)
@@ -231,15 +306,11 @@ class TestDMLAsync:
         self,
         async_empty_collection: AsyncCollection,
     ) -> None:
-        await async_empty_collection.insert_many(
+        im_result = await async_empty_collection.insert_many(
             [{"doc": i, "group": "A"} for i in range(50)]
+            + [{"doc": i, "group": "B"} for i in range(10)]
         )
-        await async_empty_collection.insert_many(
-            [{"doc": i, "group": "B"} for i in range(10)]
-        )
-        assert (
-            await async_empty_collection.count_documents(filter={}, upper_bound=100)
-        ) == 60
+        assert len(im_result.inserted_ids) == 60
         do_result1 = await async_empty_collection.delete_many({"group": "A"})
         assert isinstance(do_result1, DeleteResult)
         assert do_result1.deleted_count == 50
@@ -253,197 +324,43 @@ class TestDMLAsync:
         async_empty_collection: AsyncCollection,
     ) -> None:
         await async_empty_collection.insert_many([{"seq": i} for i in range(30)])
-        Nski = 1
-        Nlim = 28
-        Nsor = {"seq": SortDocuments.DESCENDING}
-        Nfil = {"seq": {"$exists": True}}
-
-        async def _alist(acursor: AsyncCursor) -> List[DocumentType]:
-            return [doc async for doc in acursor]
 
-        # case 0000 of find-pattern matrix
-        assert (
-            len(
-                await _alist(
-                    async_empty_collection.find(
-                        skip=None, limit=None, sort=None, filter=None
-                    )
-                )
-            )
-            == 30
-        )
-
-        # case 0001
-        assert (
-            len(
-                await _alist(
-                    async_empty_collection.find(
-                        skip=None, limit=None, sort=None, filter=Nfil
-                    )
-                )
-            )
-            == 30
-        )
-
-        # case 0010
-        assert (
-            len(
-                await _alist(
-                    async_empty_collection.find(
-                        skip=None, limit=None, sort=Nsor, filter=None
-                    )
-                )
-            )
-            == 20
-        )  # NONPAGINATED
-
-        # case 0011
-        assert (
-            len(
-                await _alist(
-                    async_empty_collection.find(
-                        skip=None, limit=None, sort=Nsor, filter=Nfil
-                    )
-                )
-            )
-            == 20
-        )  # NONPAGINATED
+        # find-pattern matrix: the expected count, or None if the API must error
+        # (all sorted cases are NONPAGINATED, i.e. capped at 20 documents)
+        expected_counts: Dict[str, Optional[int]] = {
+            "0000": 30,
+            "0001": 30,
+            "0010": 20,
+            "0011": 20,
+            "0100": 28,
+            "0101": 28,
+            "0110": 20,
+            "0111": 20,
+            "1000": None,
+            "1001": None,
+            "1010": 20,
+            "1011": 20,
+            "1100": None,
+            "1101": None,
+            "1110": 20,
+            "1111": 20,
+        }
 
-        # case 0100
-        assert (
-            len(
-                await _alist(
-                    async_empty_collection.find(
-                        skip=None, limit=Nlim, sort=None, filter=None
-                    )
+        counts = await asyncio.gather(
+            *[
+                _acount(
+                    async_empty_collection.find(**_find_case_kwargs(case_id)),
+                    upper_bound=expected_count,
                 )
-            )
-            == 28
+                for case_id, expected_count in expected_counts.items()
+            ],
+            return_exceptions=True,
         )
-
-        # case 0101
-        assert (
-            len(
-                await _alist(
-                    async_empty_collection.find(
-                        skip=None, limit=Nlim, sort=None, filter=Nfil
-                    )
-                )
-            )
-            == 28
-        )
-
-        # case 0110
-        assert (
-            len(
-                await _alist(
-                    async_empty_collection.find(
-                        skip=None, limit=Nlim, sort=Nsor, filter=None
-                    )
-                )
-            )
-            == 20
-        )  # NONPAGINATED
-
-        # case 0111
-        assert (
-            len(
-                await _alist(
-                    async_empty_collection.find(
-                        skip=None, limit=Nlim, sort=Nsor, filter=Nfil
-                    )
-                )
-            )
-            == 20
-        )  # NONPAGINATED
-
-        # case 1000
-        with pytest.raises(DataAPIResponseException):
-            len(
-                await _alist(
-                    async_empty_collection.find(
-                        skip=Nski, limit=None, sort=None, filter=None
-                    )
-                )
-            )
-
-        # case 1001
-        with pytest.raises(DataAPIResponseException):
-            len(
-                await _alist(
-                    async_empty_collection.find(
-                        skip=Nski, limit=None, sort=None, filter=Nfil
-                    )
-                )
-            )
-
-        # case 1010
-        assert (
-            len(
-                await _alist(
-                    async_empty_collection.find(
-                        skip=Nski, limit=None, sort=Nsor, filter=None
-                    )
-                )
-            )
-            == 20
-        )  # NONPAGINATED
-
-        # case 1011
-        assert (
-            len(
-                await _alist(
-                    async_empty_collection.find(
-                        skip=Nski, limit=None, sort=Nsor, filter=Nfil
-                    )
-                )
-            )
-            == 20
-        )  # NONPAGINATED
-
-        # case 1100
-        with pytest.raises(DataAPIResponseException):
-            len(
-                await _alist(
-                    async_empty_collection.find(
-                        skip=Nski, limit=Nlim, sort=None, filter=None
-                    )
-                )
-            )
-
-        # case 1101
-        with pytest.raises(DataAPIResponseException):
-            len(
-                await _alist(
-                    async_empty_collection.find(
-                        skip=Nski, limit=Nlim, sort=None, filter=Nfil
-                    )
-                )
-            )
-
-        # case 1110
-        assert (
-            len(
-                await _alist(
-                    async_empty_collection.find(
-                        skip=Nski, limit=Nlim, sort=Nsor, filter=None
-                    )
-                )
-            )
-            == 20
-        )  # NONPAGINATED
-
-        # case 1111
-        assert (
-            len(
-                await _alist(
-                    async_empty_collection.find(
-                        skip=Nski, limit=Nlim, sort=Nsor, filter=Nfil
-                    )
-                )
-            )
-            == 20
-        )  # NONPAGINATED
+        for expected_count, count in zip(expected_counts.values(), counts):
+            if expected_count is None:
+                assert isinstance(count, DataAPIResponseException)
+            else:
+                assert count == expected_count
 
     @pytest.mark.describe("test of cursors from collection.find, async")
     async def test_collection_cursors_async(
@@ -466,9 +383,6 @@ class TestDMLAsync:
         document0b = await cursor0b.__anext__()
         assert "ternary" in document0b
 
-        async def _alist(acursor: AsyncCursor) -> List[DocumentType]:
-            return [doc async for doc in acursor]
-
         # rewinding, slicing and retrieved
         cursor1 = async_empty_collection.find(sort={"seq": 1})
         await cursor1.__anext__()
@@ -494,8 +408,7 @@ class TestDMLAsync:
         # clone, alive
         cursor2 = async_empty_collection.find()
         assert cursor2.alive is True
-        for _ in range(8):
-            await cursor2.__anext__()
+        await _advance(cursor2, 8)
         assert cursor2.alive is True
         cursor3 = cursor2.clone()
         assert len(await _alist(cursor2)) == 2
@@ -504,8 +417,7 @@ class TestDMLAsync:
 
         # close
         cursor4 = async_empty_collection.find()
-        for _ in range(8):
-            await cursor4.__anext__()
+        await _advance(cursor4, 8)
         cursor4.close()
         assert cursor4.alive is False
         with pytest.raises(StopAsyncIteration):
@@ -517,15 +429,18 @@ class TestDMLAsync:
         assert (len(await _alist(cursor5))) == 10
         assert set(dist5) == {0, 1, 2}
         cursor6 = async_empty_collection.find()
-        for _ in range(9):
-            await cursor6.__anext__()
+        await _advance(cursor6, 9)
         dist6 = await cursor6.distinct("ternary")
         assert (len(await _alist(cursor6))) == 1
         assert set(dist6) == {0, 1, 2}
 
         # distinct from collections
-        assert set(await async_empty_collection.distinct("ternary")) == {0, 1, 2}
-        assert set(await async_empty_collection.distinct("nonfield")) == set()
+        dist_ternary, dist_nonfield = await asyncio.gather(
+            async_empty_collection.distinct("ternary"),
+            async_empty_collection.distinct("nonfield"),
+        )
+        assert set(dist_ternary) == {0, 1, 2}
+        assert set(dist_nonfield) == set()
 
         # Note: this, i.e. cursor[i]/cursor[i:j], is disabled
         # pending full skip/limit support by the Data API.
@@ -556,7 +471,8 @@ class TestDMLAsync:
             {"f": datetime.datetime(2000, 1, 1, 12, 00, 00)},
             {"f": None},
         ]
-        await acol.insert_many(documents * 2)
+        # the non-hashable (dict) values appear twice, to be deduplicated
+        await acol.insert_many(documents + documents[3:5])
 
         d_items = await acol.distinct("f")
         expected = [
@@ -586,11 +502,17 @@ class TestDMLAsync:
         acol = async_empty_collection
         await acol.insert_one({"x": [{"y": "Y", "0": "ZERO"}]})
 
-        assert await acol.distinct("x.y") == ["Y"]
+        d_xy, d_x0, d_x0y, d_x00 = await asyncio.gather(
+            acol.distinct("x.y"),
+            acol.distinct("x.0"),
+            acol.distinct("x.0.y"),
+            acol.distinct("x.0.0"),
+        )
+        assert d_xy == ["Y"]
         # the one below shows that if index-in-list, then browse-whole-list is off
-        assert await acol.distinct("x.0") == [{"y": "Y", "0": "ZERO"}]
-        assert await acol.distinct("x.0.y") == ["Y"]
-        assert await acol.distinct("x.0.0") == ["ZERO"]
+        assert d_x0 == [{"y": "Y", "0": "ZERO"}]
+        assert d_x0y == ["Y"]
+        assert d_x00 == ["ZERO"]
 
     @pytest.mark.describe("test of unacceptable paths for distinct, async")
     async def test_collection_wrong_paths_distinct_async(
@@ -648,24 +570,26 @@ class TestDMLAsync:
         assert top_doc is not None
         assert top_doc["tag"] == "D"
 
-        fdoc_no_s = await async_empty_collection.find(
-            {}, sort={"$vector": [1, 1]}, include_similarity=False
-        ).__anext__()
-        fdoc_wi_s = await async_empty_collection.find(
-            {}, sort={"$vector": [1, 1]}, include_similarity=True
-        ).__anext__()
+        fdoc_no_s, fdoc_wi_s, f1doc_no_s, f1doc_wi_s = await asyncio.gather(
+            async_empty_collection.find(
+                {}, sort={"$vector": [1, 1]}, include_similarity=False
+            ).__anext__(),
+            async_empty_collection.find(
+                {}, sort={"$vector": [1, 1]}, include_similarity=True
+            ).__anext__(),
+            async_empty_collection.find_one(
+                {}, sort={"$vector": [1, 1]}, include_similarity=False
+            ),
+            async_empty_collection.find_one(
+                {}, sort={"$vector": [1, 1]}, include_similarity=True
+            ),
+        )
         assert fdoc_no_s is not None
         assert fdoc_wi_s is not None
         assert "$similarity" not in fdoc_no_s
         assert "$similarity" in fdoc_wi_s
         assert fdoc_wi_s["$similarity"] > 0.0
 
-        f1doc_no_s = await async_empty_collection.find_one(
-            {}, sort={"$vector": [1, 1]}, include_similarity=False
-        )
-        f1doc_wi_s = await async_empty_collection.find_one(
-            {}, sort={"$vector": [1, 1]}, include_similarity=True
-        )
         assert f1doc_no_s is not None
         assert f1doc_wi_s is not None
         assert "$similarity" not in f1doc_no_s
@@ -685,9 +609,6 @@ class TestDMLAsync:
     ) -> None:
         q_vector = [10, 9]
 
-        async def _alist(acursor: AsyncCursor) -> List[DocumentType]:
-            return [doc async for doc in acursor]
-
         # with empty collection
         for include_sv in [False, True]:
             for sort_cl_label in ["reg", "vec"]:
@@ -834,24 +755,34 @@ class TestDMLAsync:
 
         ins_result1 = await acol.insert_many([{"_id": "a"}, {"_id": "b"}], ordered=True)
         assert set(ins_result1.inserted_ids) == {"a", "b"}
-        assert {doc["_id"] async for doc in acol.find()} == {"a", "b"}
+        assert {doc["_id"] async for doc in acol.find(projection=["_id"])} == {"a", "b"}
 
         with pytest.raises(InsertManyException):
             await acol.insert_many([{"_id": "a"}, {"_id": "c"}], ordered=True)
-        assert {doc["_id"] async for doc in acol.find()} == {"a", "b"}
+        assert {doc["_id"] async for doc in acol.find(projection=["_id"])} == {"a", "b"}
 
         with pytest.raises(InsertManyException):
             await acol.insert_many(
                 [{"_id": "c"}, {"_id": "a"}, {"_id": "d"}], ordered=True
             )
-        assert {doc["_id"] async for doc in acol.find()} == {"a", "b", "c"}
+        assert {doc["_id"] async for doc in acol.find(projection=["_id"])} == {
+            "a",
+            "b",
+            "c",
+        }
 
         with pytest.raises(InsertManyException):
             await acol.insert_many(
                 [{"_id": "c"}, {"_id": "d"}, {"_id": "e"}],
                 ordered=False,
             )
-        assert {doc["_id"] async for doc in acol.find()} == {"a", "b", "c", "d", "e"}
+        assert {doc["_id"] async for doc in acol.find(projection=["_id"])} == {
+            "a",
+            "b",
+            "c",
+            "d",
+            "e",
+        }
 
     @pytest.mark.describe("test of collection insert_many with vectors, async")
     async def test_collection_insert_many_vectors_async(
@@ -871,7 +802,9 @@ class TestDMLAsync:
                 vectors=[None, None],
             )
 
-        vectors = [doc["$vector"] async for doc in acol.find({}, projection={"*": 1})]
+        vectors = [
+            doc["$vector"] async for doc in acol.find({}, projection={"$vector": True})
+        ]
         assert all(len(vec) == 2 for vec in vectors)
 
         with pytest.raises(ValueError):
@@ -935,127 +868,44 @@ class TestDMLAsync:
     ) -> None:
         acol = async_empty_collection
 
-        resp0000 = await acol.find_one_and_replace({"f": 0}, {"r": 1})
-        assert resp0000 is None
-        assert await acol.count_documents({}, upper_bound=100) == 0
-
-        resp0001 = await acol.find_one_and_replace({"f": 0}, {"r": 1}, sort={"x": 1})
-        assert resp0001 is None
-        assert await acol.count_documents({}, upper_bound=100) == 0
-
-        resp0010 = await acol.find_one_and_replace({"f": 0}, {"r": 1}, upsert=True)
-        assert resp0010 is None
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        resp0011 = await acol.find_one_and_replace(
-            {"f": 0}, {"r": 1}, upsert=True, sort={"x": 1}
-        )
-        assert resp0011 is None
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        await acol.insert_one({"f": 0})
-        resp0100 = await acol.find_one_and_replace({"f": 0}, {"r": 1})
-        assert resp0100 is not None
-        assert resp0100["f"] == 0
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        await acol.insert_one({"f": 0})
-        resp0101 = await acol.find_one_and_replace({"f": 0}, {"r": 1}, sort={"x": 1})
-        assert resp0101 is not None
-        assert resp0101["f"] == 0
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        await acol.insert_one({"f": 0})
-        resp0110 = await acol.find_one_and_replace({"f": 0}, {"r": 1}, upsert=True)
-        assert resp0110 is not None
-        assert resp0110["f"] == 0
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        await acol.insert_one({"f": 0})
-        resp0111 = await acol.find_one_and_replace(
-            {"f": 0}, {"r": 1}, upsert=True, sort={"x": 1}
-        )
-        assert resp0111 is not None
-        assert resp0111["f"] == 0
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        resp1000 = await acol.find_one_and_replace(
-            {"f": 0}, {"r": 1}, return_document=ReturnDocument.AFTER
-        )
-        assert resp1000 is None
-        assert await acol.count_documents({}, upper_bound=100) == 0
-
-        resp1001 = await acol.find_one_and_replace(
-            {"f": 0}, {"r": 1}, sort={"x": 1}, return_document=ReturnDocument.AFTER
-        )
-        assert resp1001 is None
-        assert await acol.count_documents({}, upper_bound=100) == 0
-
-        resp1010 = await acol.find_one_and_replace(
-            {"f": 0}, {"r": 1}, upsert=True, return_document=ReturnDocument.AFTER
-        )
-        assert resp1010 is not None
-        assert resp1010["r"] == 1
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        resp1011 = await acol.find_one_and_replace(
-            {"f": 0},
-            {"r": 1},
-            upsert=True,
-            sort={"x": 1},
-            return_document=ReturnDocument.AFTER,
-        )
-        assert resp1011 is not None
-        assert resp1011["r"] == 1
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        await acol.insert_one({"f": 0})
-        resp1100 = await acol.find_one_and_replace(
-            {"f": 0}, {"r": 1}, return_document=ReturnDocument.AFTER
-        )
-        assert resp1100 is not None
-        assert resp1100["r"] == 1
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        await acol.insert_one({"f": 0})
-        resp1101 = await acol.find_one_and_replace(
-            {"f": 0}, {"r": 1}, sort={"x": 1}, return_document=ReturnDocument.AFTER
-        )
-        assert resp1101 is not None
-        assert resp1101["r"] == 1
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        await acol.insert_one({"f": 0})
-        resp1110 = await acol.find_one_and_replace(
-            {"f": 0}, {"r": 1}, upsert=True, return_document=ReturnDocument.AFTER
+        # sub-cases (see _find_one_and_case_kwargs) each work on their own "f"
+        # value: a single seeding is enough and they can run concurrently.
+        case_ids = [f"{case_index:04b}" for case_index in range(16)]
+        await acol.insert_many(
+            [{"f": case_id} for case_id in case_ids if case_id[1] == "1"]
+        )
+        resps = await asyncio.gather(
+            *[
+                acol.find_one_and_replace(
+                    {"f": case_id},
+                    {"r": case_id},
+                    **_find_one_and_case_kwargs(case_id),
+                )
+                for case_id in case_ids
+            ]
         )
-        assert resp1110 is not None
-        assert resp1110["r"] == 1
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        await acol.insert_one({"f": 0})
-        resp1111 = await acol.find_one_and_replace(
-            {"f": 0},
-            {"r": 1},
-            upsert=True,
-            sort={"x": 1},
-            return_document=ReturnDocument.AFTER,
+        for case_id, resp in zip(case_ids, resps):
+            is_after, has_match, is_upsert, _ = (digit == "1" for digit in case_id)
+            if has_match and not is_after:
+                assert resp is not None
+                assert resp["f"] == case_id
+            elif is_after and (has_match or is_upsert):
+                assert resp is not None
+                assert resp["r"] == case_id
+            else:
+                assert resp is None
+            if TEST_STRICT_COUNTS:
+                expected_count = 1 if (has_match or is_upsert) else 0
+                assert (
+                    await acol.count_documents({"r": case_id}, upper_bound=100)
+                    == expected_count
+                )
+        # overall, a document was written in all cases with a match or an upsert
+        assert (
+            await acol.count_documents({"r": {"$exists": True}}, upper_bound=100) == 12
         )
-        assert resp1111 is not None
-        assert resp1111["r"] == 1
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
+        # and nothing else: the 8 seeded documents, plus the 4 upserts
+        assert await acol.count_documents({}, upper_bound=100) == 12
 
         # projection
         await acol.insert_one({"f": 100, "name": "apple", "mode": "old"})
@@ -1075,7 +925,6 @@ class TestDMLAsync:
         )
         assert resp_pr2 is not None
         assert set(resp_pr2.keys()) == {"mode"}
-        await acol.delete_many({})
 
     @pytest.mark.describe("test of replace_one, async")
     async def test_collection_replace_one_async(
@@ -1226,8 +1075,9 @@ class TestDMLAsync:
         async_empty_collection: AsyncCollection,
     ) -> None:
         acol = async_empty_collection
-        await acol.insert_many([{"a": 1} for _ in range(50)])
-        await acol.insert_many([{"a": 10} for _ in range(10)])
+        await acol.insert_many(
+            [{"a": 1} for _ in range(50)] + [{"a": 10} for _ in range(10)]
+        )
 
         um_result = await acol.update_many({"a": 1}, {"$set": {"b": 2}})
         assert um_result.update_info["n"] == 50
@@ -1243,13 +1093,14 @@ class TestDMLAsync:
         self,
         async_empty_collection: AsyncCollection,
     ) -> None:
-        await async_empty_collection.insert_one({"doc": 1, "group": "A"})
-        await async_empty_collection.insert_one({"doc": 2, "group": "B"})
-        await async_empty_collection.insert_one({"doc": 3, "group": "A"})
-        assert (
-            await async_empty_collection.count_documents(filter={}, upper_bound=100)
-            == 3
+        im_result = await async_empty_collection.insert_many(
+            [
+                {"doc": 1, "group": "A"},
+                {"doc": 2, "group": "B"},
+                {"doc": 3, "group": "A"},
+            ]
         )
+        assert len(im_result.inserted_ids) == 3
 
         fo_result1 = await async_empty_collection.find_one_and_delete({"group": "A"})
         assert fo_result1 is not None
@@ -1305,151 +1156,43 @@ class TestDMLAsync:
     ) -> None:
         acol = async_empty_collection
 
-        resp0000 = await acol.find_one_and_update({"f": 0}, {"$set": {"n": 1}})
-        assert resp0000 is None
-        assert await acol.count_documents({}, upper_bound=100) == 0
-
-        resp0001 = await acol.find_one_and_update(
-            {"f": 0}, {"$set": {"n": 1}}, sort={"x": 1}
-        )
-        assert resp0001 is None
-        assert await acol.count_documents({}, upper_bound=100) == 0
-
-        resp0010 = await acol.find_one_and_update(
-            {"f": 0}, {"$set": {"n": 1}}, upsert=True
-        )
-        assert resp0010 is None
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        resp0011 = await acol.find_one_and_update(
-            {"f": 0}, {"$set": {"n": 1}}, upsert=True, sort={"x": 1}
-        )
-        assert resp0011 is None
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        await acol.insert_one({"f": 0})
-        resp0100 = await acol.find_one_and_update({"f": 0}, {"$set": {"n": 1}})
-        assert resp0100 is not None
-        assert resp0100["f"] == 0
-        assert "n" not in resp0100
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        await acol.insert_one({"f": 0})
-        resp0101 = await acol.find_one_and_update(
-            {"f": 0}, {"$set": {"n": 1}}, sort={"x": 1}
-        )
-        assert resp0101 is not None
-        assert resp0101["f"] == 0
-        assert "n" not in resp0101
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        await acol.insert_one({"f": 0})
-        resp0110 = await acol.find_one_and_update(
-            {"f": 0}, {"$set": {"n": 1}}, upsert=True
-        )
-        assert resp0110 is not None
-        assert resp0110["f"] == 0
-        assert "n" not in resp0110
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        await acol.insert_one({"f": 0})
-        resp0111 = await acol.find_one_and_update(
-            {"f": 0}, {"$set": {"n": 1}}, upsert=True, sort={"x": 1}
-        )
-        assert resp0111 is not None
-        assert resp0111["f"] == 0
-        assert "n" not in resp0111
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        resp1000 = await acol.find_one_and_update(
-            {"f": 0}, {"$set": {"n": 1}}, return_document=ReturnDocument.AFTER
-        )
-        assert resp1000 is None
-        assert await acol.count_documents({}, upper_bound=100) == 0
-
-        resp1001 = await acol.find_one_and_update(
-            {"f": 0},
-            {"$set": {"n": 1}},
-            sort={"x": 1},
-            return_document=ReturnDocument.AFTER,
-        )
-        assert resp1001 is None
-        assert await acol.count_documents({}, upper_bound=100) == 0
-
-        resp1010 = await acol.find_one_and_update(
-            {"f": 0},
-            {"$set": {"n": 1}},
-            upsert=True,
-            return_document=ReturnDocument.AFTER,
-        )
-        assert resp1010 is not None
-        assert resp1010["n"] == 1
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        resp1011 = await acol.find_one_and_update(
-            {"f": 0},
-            {"$set": {"n": 1}},
-            upsert=True,
-            sort={"x": 1},
-            return_document=ReturnDocument.AFTER,
-        )
-        assert resp1011 is not None
-        assert resp1011["n"] == 1
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        await acol.insert_one({"f": 0})
-        resp1100 = await acol.find_one_and_update(
-            {"f": 0}, {"$set": {"n": 1}}, return_document=ReturnDocument.AFTER
-        )
-        assert resp1100 is not None
-        assert resp1100["n"] == 1
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        await acol.insert_one({"f": 0})
-        resp1101 = await acol.find_one_and_update(
-            {"f": 0},
-            {"$set": {"n": 1}},
-            sort={"x": 1},
-            return_document=ReturnDocument.AFTER,
-        )
-        assert resp1101 is not None
-        assert resp1101["n"] == 1
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        await acol.insert_one({"f": 0})
-        resp1110 = await acol.find_one_and_update(
-            {"f": 0},
-            {"$set": {"n": 1}},
-            upsert=True,
-            return_document=ReturnDocument.AFTER,
-        )
-        assert resp1110 is not None
-        assert resp1110["n"] == 1
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
-
-        await acol.insert_one({"f": 0})
-        resp1111 = await acol.find_one_and_update(
-            {"f": 0},
-            {"$set": {"n": 1}},
-            upsert=True,
-            sort={"x": 1},
-            return_document=ReturnDocument.AFTER,
+        # sub-cases (see _find_one_and_case_kwargs) each work on their own "k"
+        # value: a single seeding is enough and they can run concurrently.
+        case_ids = [f"{case_index:04b}" for case_index in range(16)]
+        await acol.insert_many(
+            [{"f": 0, "k": case_id} for case_id in case_ids if case_id[1] == "1"]
+        )
+        resps = await asyncio.gather(
+            *[
+                acol.find_one_and_update(
+                    {"f": 0, "k": case_id},
+                    {"$set": {"n": 1}},
+                    **_find_one_and_case_kwargs(case_id),
+                )
+                for case_id in case_ids
+            ]
         )
-        assert resp1111 is not None
-        assert resp1111["n"] == 1
-        assert await acol.count_documents({}, upper_bound=100) == 1
-        await acol.delete_many({})
+        for case_id, resp in zip(case_ids, resps):
+            is_after, has_match, is_upsert, _ = (digit == "1" for digit in case_id)
+            if has_match and not is_after:
+                assert resp is not None
+                assert resp["f"] == 0
+                assert "n" not in resp
+            elif is_after and (has_match or is_upsert):
+                assert resp is not None
+                assert resp["n"] == 1
+            else:
+                assert resp is None
+            if TEST_STRICT_COUNTS:
+                expected_count = 1 if (has_match or is_upsert) else 0
+                assert (
+                    await acol.count_documents({"k": case_id}, upper_bound=100)
+                    == expected_count
+                )
+        # overall, a document was written in all cases with a match or an upsert
+        assert await acol.count_documents({"n": 1}, upper_bound=100) == 12
+        # and nothing else: the 8 seeded documents, plus the 4 upserts
+        assert await acol.count_documents({}, upper_bound=100) == 12
 
         # projection
         await acol.insert_one({"f": 100, "name": "apple", "mode": "old"})
@@ -1469,7 +1212,6 @@ class TestDMLAsync:
         )
         assert resp_pr2 is not None
         assert set(resp_pr2.keys()) == {"f"}
-        await acol.delete_many({})
 
     @pytest.mark.describe("test of ordered bulk_write, async")
     async def test_collection_ordered_bulk_write_async(
@@ -1500,16 +1242,20 @@ class TestDMLAsync:
         assert bw_result.upserted_count == 1
         assert set(bw_result.upserted_ids.keys()) == {7}
 
-        found_docs = sorted(
-            [doc async for doc in acol.find({})],
-            key=lambda doc: doc.get("seq", 10),
-        )
+        # "positive" is projected too, to check that it was dropped by the replace
+        found_docs = [
+            doc
+            async for doc in acol.find(
+                {}, projection=["seq", "edited", "positive", "from_upsert"]
+            )
+        ]
         assert len(found_docs) == 2
-        assert found_docs[0]["seq"] == 0
-        assert found_docs[0]["edited"] == 2
-        assert "_id" in found_docs[0]
-        assert len(found_docs[0]) == 3
-        assert found_docs[1] == {"_id": "seq4", "from_upsert": True}
+        seq_doc = next(doc for doc in found_docs if "seq" in doc)
+        assert seq_doc["seq"] == 0
+        assert seq_doc["edited"] == 2
+        assert "_id" in seq_doc
+        assert len(seq_doc) == 3
+        assert {"_id": "seq4", "from_upsert": True} in found_docs
 
     @pytest.mark.describe("test of unordered bulk_write, async")
     async def test_collection_unordered_bulk_write_async(
@@ -1533,7 +1279,9 @@ class TestDMLAsync:
         assert bw_u_result.upserted_count == 1
         assert set(bw_u_result.upserted_ids.keys()) == {1}
 
-        found_docs = [doc async for doc in acol.find({})]
+        found_docs = [
+            doc async for doc in acol.find({}, projection=["a", "b", "newfield"])
+        ]
         no_id_found_docs = [
             {k: v for k, v in doc.items() if k != "_id"} for doc in found_docs
         ]
@@ -1541,6 +1289,21 @@ class TestDMLAsync:
         assert {"a": 1} in no_id_found_docs
         assert {"b": 1, "newfield": True} in no_id_found_docs
 
+    @pytest.mark.describe("test of unordered bulk_write with concurrency, async")
+    async def test_collection_unordered_bulk_write_concurrency_async(
+        self,
+        async_empty_collection: AsyncCollection,
+    ) -> None:
+        acol = async_empty_collection
+
+        bw_c_ops = [AsyncInsertOne({"x": i}) for i in range(32)]
+
+        bw_c_result = await acol.bulk_write(bw_c_ops, ordered=False, concurrency=16)
+
+        assert bw_c_result.inserted_count == 32
+        assert set(bw_c_result.bulk_api_results.keys()) == set(range(32))
+        assert sorted(await acol.distinct("x")) == list(range(32))
+
     @pytest.mark.describe("test of bulk_write with vectors, async")
     async def test_collection_bulk_write_vector_async(
         self,
@@ -1571,29 +1334,23 @@ class TestDMLAsync:
         self,
         async_empty_collection: AsyncCollection,
     ) -> None:
-        types_and_ids = {
-            "uuid1": UUID("8ccd6ff8-e61b-11ee-a2fc-7df4a8c4164b"),
-            "uuid3": UUID("6fa459ea-ee8a-3ca4-894e-db77e160355e"),
-            "uuid4": UUID("4f16cba8-1115-43ab-aa39-3a9c29f37db5"),
-            "uuid5": UUID("886313e1-3b8a-5372-9b90-0c9aee199e5d"),
-            "uuid6": UUID("1eee61b9-8f2d-69ad-8ebb-5054d2a1a2c0"),
-            "uuid7": UUID("018e57e5-f586-7ed6-be55-6b0de3041116"),
-            "uuid8": UUID("018e57e5-fbcd-8bd4-b794-be914f2c4c85"),
-            "objectid": ObjectId("65f9cfa0d7fabb3f255c25a1"),
-        }
-
         await async_empty_collection.insert_many(
             [
                 {"_id": t_id, "id_type": t_id_type}
-                for t_id_type, t_id in types_and_ids.items()
+                for t_id_type, t_id in TYPES_AND_IDS.items()
             ]
         )
 
-        for t_id_type, t_id in types_and_ids.items():
-            this_doc = await async_empty_collection.find_one(
-                {"_id": t_id},
-                projection={"id_type": True},
-            )
+        docs = await asyncio.gather(
+            *[
+                async_empty_collection.find_one(
+                    {"_id": t_id},
+                    projection={"id_type": True},
+                )
+                for t_id in TYPES_AND_IDS.values()
+            ]
+        )
+        for t_id_type, this_doc in zip(TYPES_AND_IDS.keys(), docs):
             assert this_doc is not None
             assert this_doc["id_type"] == t_id_type
 
@@ -1604,18 +1361,8 @@ class TestDMLAsync:
         self,
         async_empty_collection: AsyncCollection,
     ) -> None:
-        types_and_ids = {
-            "uuid1": UUID("8ccd6ff8-e61b-11ee-a2fc-7df4a8c4164b"),
-            "uuid3": UUID("6fa459ea-ee8a-3ca4-894e-db77e160355e"),
-            "uuid4": UUID("4f16cba8-1115-43ab-aa39-3a9c29f37db5"),
-            "uuid5": UUID("886313e1-3b8a-5372-9b90-0c9aee199e5d"),
-            "uuid6": UUID("1eee61b9-8f2d-69ad-8ebb-5054d2a1a2c0"),
-            "uuid7": UUID("018e57e5-f586-7ed6-be55-6b0de3041116"),
-            "uuid8": UUID("018e57e5-fbcd-8bd4-b794-be914f2c4c85"),
-            "objectid": ObjectId("65f9cfa0d7fabb3f255c25a1"),
-        }
         wide_document = {
-            "all_ids": types_and_ids,
+            "all_ids": TYPES_AND_IDS,
             "_id": 0,
             "name": "wide_document",
             "touched_times": 0,
@@ -1625,14 +1372,19 @@ class TestDMLAsync:
         full_doc = await async_empty_collection.find_one({})
         assert full_doc == wide_document
 
-        for t_id_type, t_id in types_and_ids.items():
-            doc = await async_empty_collection.find_one(
-                {f"all_ids.{t_id_type}": t_id}, projection={"name": True}
-            )
+        docs = await asyncio.gather(
+            *[
+                async_empty_collection.find_one(
+                    {f"all_ids.{t_id_type}": t_id}, projection={"name": True}
+                )
+                for t_id_type, t_id in TYPES_AND_IDS.items()
+            ]
+        )
+        for doc in docs:
             assert doc is not None
             assert doc["name"] == "wide_document"
 
-        for upd_index, (t_id_type, t_id) in enumerate(types_and_ids.items()):
+        for upd_index, (t_id_type, t_id) in enumerate(TYPES_AND_IDS.items()):
             updated_doc = await async_empty_collection.find_one_and_update(
                 {f"all_ids.{t_id_type}": t_id},
                 {"$inc": {"touched_times": 1}},
@@ -1644,14 +1396,14 @@ class TestDMLAsync:
         await async_empty_collection.delete_one({"_id": 0})
 
         await async_empty_collection.insert_many(
-            [{"_id": t_id} for t_id in types_and_ids.values()]
+            [{"_id": t_id} for t_id in TYPES_AND_IDS.values()]
         )
 
         count = await async_empty_collection.count_documents({}, upper_bound=20)
-        assert count == len(types_and_ids)
+        assert count == len(TYPES_AND_IDS)
 
-        for del_index, t_id in enumerate(types_and_ids.values()):
+        for del_index, t_id in enumerate(TYPES_AND_IDS.values()):
             del_result = await async_empty_collection.delete_one({"_id": t_id})
             assert del_result.deleted_count == 1
             count = await async_empty_collection.count_documents({}, upper_bound=20)
-            assert count == len(types_and_ids) - del_index - 1
+            assert count == len(TYPES_AND_IDS) - del_index - 1
@@ -35,6 +35,9 @@ from astrapy.operations import AsyncInsertOne
 
 from ..conftest import IS_ASTRA_DB, DataAPICredentials
 
+# all tests share the module-scoped async_empty_collection and its pool
+pytestmark = pytest.mark.asyncio(scope="module")
+
 
 class TestExceptionsAsync:
     @pytest.mark.describe("test of collection insert_many type-failure modes, async")
@@ -25,6 +25,9 @@ from astrapy.operations import AsyncDeleteMany, AsyncInsertMany
 
 from ..conftest import IS_ASTRA_DB
 
+# all tests share the module-scoped async_empty_collection and its pool
+pytestmark = pytest.mark.asyncio(scope="module")
+
 
 class TestTimeoutAsync:
     @pytest.mark.describe("test of collection count_documents timeout, async")
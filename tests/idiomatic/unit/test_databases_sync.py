@@ -14,6 +14,8 @@
 
 from __future__ import annotations
 
+from typing import Any, Dict, List
+
 import pytest
 
 from astrapy import Collection, DataAPIClient, Database
@@ -277,3 +279,27 @@ class TestDatabasesSync:
         assert db_m.namespace == "M"
         db_n = db_admin.get_database()
         assert db_n.namespace is None
+
+    @pytest.mark.describe("test of database region lookups being cached, sync")
+    def test_database_region_lookup_cached_sync(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        db_id = "01234567-89ab-cdef-0123-456789abcdef"
+        lookups: List[str] = []
+
+        def _fake_fetch(id: str, **kwargs: Any) -> Dict[str, Any]:
+            lookups.append(id)
+            return {"info": {"region": "reg-1"}}
+
+        monkeypatch.setattr(
+            "astrapy.admin.fetch_raw_database_info_from_id_token", _fake_fetch
+        )
+        client = DataAPIClient("region-cache-token")
+        db1 = client.get_database(db_id)
+        db2 = client.get_database(db_id, namespace="ns")
+        assert db1.api_endpoint == db2.api_endpoint
+        assert "reg-1" in db1.api_endpoint
+        assert lookups == [db_id]
+
+        DataAPIClient("another-token").get_database(db_id)
+        assert lookups == [db_id, db_id]
@@ -131,6 +131,13 @@ if "DO_IDIOMATIC_ADMIN_TESTS" in os.environ:
 else:
     DO_IDIOMATIC_ADMIN_TESTS = False
 
+# extra count_documents checks after each step of the DML "matrix" tests
+TEST_STRICT_COUNTS: bool
+if os.getenv("TEST_STRICT_COUNTS"):
+    TEST_STRICT_COUNTS = int(os.environ["TEST_STRICT_COUNTS"]) != 0
+else:
+    TEST_STRICT_COUNTS = False
+
 ADMIN_ENV_LIST = ["prod", "dev"]
 ADMIN_ENV_VARIABLE_MAP = {
     admin_env: {